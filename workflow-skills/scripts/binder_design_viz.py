@@ -14,30 +14,58 @@ Each figure is saved as a separate 4x4 inch file.
 """
 
 import argparse
+import functools
+import importlib.util
 import json
 import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
 from matplotlib.patches import Rectangle
 from matplotlib.table import Table
+from matplotlib.ticker import FixedFormatter, FixedLocator
 import numpy as np
 import pandas as pd
 from scipy import stats
 import seaborn as sns
+from PIL import Image
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json parser is used instead
+    orjson = None
+
+# pyarrow is optional; without it metrics CSVs go through pandas' C parser
+HAVE_PYARROW = importlib.util.find_spec('pyarrow') is not None
 
 # Color palettes from plot_style_utils (matching fitness_modeling_viz.py)
 CAT_PALETTE = sns.color_palette('colorblind')
-DIV_PALETTE = sns.color_palette("BrBG_r", 100)
-SEQ_PALETTE = sns.cubehelix_palette(100, start=0.5, rot=-0.75)
+CAT_PALETTE_RGB = np.asarray(CAT_PALETTE)  # (10, 3) array for indexing by position
 GRAY = [0.5, 0.5, 0.5]
 
 # Figure size for individual plots
 FIGSIZE = (4, 4)
 
+# Bars and scatter points are rasterized inside PDFs from this many designs;
+# below it the vector shapes are both smaller and faster to write
+RASTERIZE_MIN_DESIGNS = 20000
+
+# Scatter points are labelled with design names only up to this many designs;
+# past it the labels overlap into an unreadable block and dominate render time
+ANNOTATE_MAX_DESIGNS = 30
+
+# zlib level for PNG output; level 1 writes several times faster than the
+# default level 6 for slightly larger files
+PNG_COMPRESS_LEVEL = 1
+
 # Quality thresholds for binder designs
 QUALITY_THRESHOLDS = {
     'plddt_good': 80,
@@ -50,6 +78,66 @@ QUALITY_THRESHOLDS = {
     'i_ptm_acceptable': 0.4,
 }
 
+# BindCraft column names -> standard names (BindCraft uses Average_pLDDT, Average_i_pAE, etc.)
+BINDCRAFT_COLUMNS = {
+    'Design': 'design_name',
+    'Rank': 'rank',
+    'Average_pLDDT': 'plddt',
+    'Average_pTM': 'ptm',
+    'Average_i_pTM': 'i_ptm',
+    'Average_pAE': 'pae',
+    'Average_i_pAE': 'i_pae',
+    'Average_i_pLDDT': 'i_plddt',
+    'Average_ss_pLDDT': 'ss_plddt',
+    'Average_dG': 'dG',
+    'Average_dSASA': 'dSASA',
+    'Average_ShapeComplementarity': 'shape_complementarity',
+    'Average_n_InterfaceResidues': 'n_interface_residues',
+    'Average_n_InterfaceHbonds': 'n_interface_hbonds',
+    'Length': 'length',
+    'Seed': 'seed',
+    'MPNN_score': 'mpnn_score',
+    'MPNN_seq_recovery': 'mpnn_seq_recovery',
+    # Also handle trajectory stats format (no Average_ prefix)
+    'pLDDT': 'plddt',
+    'pTM': 'ptm',
+    'i_pTM': 'i_ptm',
+    'i_pAE': 'i_pae',
+    'i_pLDDT': 'i_plddt',
+    'ss_pLDDT': 'ss_plddt',
+}
+
+# Common variations of generic column names -> standard names
+GENERIC_COLUMNS = {
+    'design': 'design_name',
+    'name': 'design_name',
+    'pLDDT': 'plddt',
+    'PLDDT': 'plddt',
+    'pAE': 'pae',
+    'PAE': 'pae',
+    'interface_pae': 'i_pae',
+    'interface_plddt': 'i_plddt',
+    'interface_ptm': 'i_ptm',
+    'pTM': 'ptm',
+    'PTM': 'ptm',
+}
+
+# Score columns are parsed as float32, under their raw and standard names
+SCORE_COLUMNS = ('plddt', 'pae', 'i_pae', 'i_ptm', 'i_plddt', 'ptm')
+SCORE_DTYPES = {
+    name: 'float32'
+    for mapping in (BINDCRAFT_COLUMNS, GENERIC_COLUMNS, {c: c for c in SCORE_COLUMNS})
+    for name, std in mapping.items() if std in SCORE_COLUMNS
+}
+
+# Metrics CSV columns the figures use (design names and scores, under raw and
+# standard names); BindCraft stats files carry many more that are never read
+CSV_COLUMNS = frozenset(SCORE_DTYPES) | {'design_name'} | {
+    name
+    for mapping in (BINDCRAFT_COLUMNS, GENERIC_COLUMNS)
+    for name, std in mapping.items() if std == 'design_name'
+}
+
 
 def prettify_ax(ax):
     """Make axes more pleasant to look at"""
@@ -61,24 +149,126 @@ def prettify_ax(ax):
     ax.set_axisbelow(True)
 
 
-def simple_ax(figsize=FIGSIZE, **kwargs):
+def new_figure(figsize, fig=None):
+    """A new figure, or `fig` cleared and resized for reuse.
+
+    Drawing a run of plots on one Figure skips creating and tearing down a
+    figure manager and canvas per plot.
+    """
+    if fig is None:
+        return plt.figure(figsize=figsize)
+    fig.clear()
+    fig.set_size_inches(figsize)
+    fig.set_dpi(plt.rcParams['figure.dpi'])
+    fig.patch.set_facecolor(plt.rcParams['figure.facecolor'])
+    fig.patch.set_edgecolor(plt.rcParams['figure.edgecolor'])
+    return fig
+
+
+def simple_ax(figsize=FIGSIZE, fig=None, **kwargs):
     """Shortcut to make and 'prettify' a simple figure with 1 axis"""
-    fig = plt.figure(figsize=figsize)
+    fig = new_figure(figsize, fig)
     ax = fig.add_subplot(111, **kwargs)
     prettify_ax(ax)
     return fig, ax
 
 
+# Context last applied by set_pub_plot_context, so repeated calls are free
+_PLOT_CONTEXT = None
+
+
+def set_category_ticks(axis, positions, labels, fontsize, rotation=0, ha=None):
+    """Put one labelled tick per category on an x or y axis.
+
+    Label size and rotation go in as tick defaults before the labels exist,
+    so the text is laid out once at its final style.
+    """
+    axis.set_tick_params(labelsize=fontsize, labelrotation=rotation)
+    axis.set_major_locator(FixedLocator(positions))
+    axis.set_major_formatter(FixedFormatter(labels))
+    if ha is not None:
+        for label in axis.get_ticklabels():
+            label.set_horizontalalignment(ha)
+
+
 def set_pub_plot_context(context="talk"):
     """Set publication-quality plot context"""
+    global _PLOT_CONTEXT
+    if context == _PLOT_CONTEXT:
+        return
     sns.set(style="white", context=context)
+    _PLOT_CONTEXT = context
+
 
+def write_png(fig, path, dpi, transparent=False, pad_inches=0.1):
+    """Draw the figure once with Agg and write the PNG from the canvas buffer.
 
-def save_for_pub(fig, path, dpi=300, include_raster=True):
-    """Save figure in publication-ready formats"""
-    fig.savefig(path + ".pdf", dpi=dpi, bbox_inches='tight', transparent=True)
+    The same draw measures the tight bounding box; it is returned (in inches)
+    so a PDF saved afterwards crops identically without another measuring draw.
+    """
+    if transparent:
+        for patch in [fig.patch] + [ax.patch for ax in fig.axes]:
+            patch.set_facecolor('none')
+            patch.set_edgecolor('none')
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    fig.set_layout_engine('none')
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad_inches)
+
+    # Copy the tight box out of the buffer (Agg rows run top to bottom); the
+    # padding may reach past the canvas, where it takes the figure background
+    buf = np.asarray(fig.canvas.buffer_rgba())
+    height, width = buf.shape[:2]
+    x0, y0, x1, y1 = np.rint(bbox.extents * dpi).astype(int)
+    top, left = height - y1, x0
+    out = np.empty((y1 - y0, x1 - x0, 4), dtype=np.uint8)
+    out[:] = np.rint(np.asarray(to_rgba(fig.patch.get_facecolor())) * 255)
+    src_rows = slice(max(top, 0), min(height - y0, height))
+    src_cols = slice(max(left, 0), min(x1, width))
+    out[src_rows.start - top:src_rows.stop - top, src_cols.start - left:src_cols.stop - left] = buf[src_rows, src_cols]
+    Image.fromarray(out).save(path, compress_level=PNG_COMPRESS_LEVEL, dpi=(dpi, dpi))
+    return bbox
+
+
+def save_for_pub(fig, path, dpi=300, include_raster=True, include_vector=True):
+    """Save figure in publication-ready formats.
+
+    Returns the paths written. Vector PDF is much slower to write than PNG,
+    so routine runs pass include_vector=False.
+    """
+    saved = []
+    bbox = 'tight'
     if include_raster:
-        fig.savefig(path + ".png", dpi=dpi, bbox_inches='tight', transparent=True)
+        bbox = write_png(fig, path + ".png", dpi, transparent=True)
+        saved.append(path + ".png")
+    if include_vector:
+        fig.savefig(path + ".pdf", dpi=dpi, bbox_inches=bbox, transparent=True)
+        saved.append(path + ".pdf")
+    return saved
+
+
+# Parsed metrics CSVs keyed by (path, mtime, size), so creating the separate
+# and merged figures in one session parses the CSV once
+_CSV_CACHE = {}
+
+
+def read_metrics_csv(csv_path: Path) -> pd.DataFrame:
+    """Read the CSV_COLUMNS of a metrics CSV, with score columns as float32.
+
+    Uses pyarrow's multithreaded CSV parser when it is installed. Repeated
+    reads reuse the parsed table until the file changes on disk.
+    """
+    stat = csv_path.stat()
+    key = (str(csv_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    if key not in _CSV_CACHE:
+        _CSV_CACHE.clear()  # Keep only the latest table
+        # Both engines accept a plain column list, so pick it from the header
+        usecols = [col for col in pd.read_csv(csv_path, nrows=0).columns if col in CSV_COLUMNS]
+        if HAVE_PYARROW:
+            _CSV_CACHE[key] = pd.read_csv(csv_path, engine='pyarrow', usecols=usecols, dtype=SCORE_DTYPES)
+        else:
+            _CSV_CACHE[key] = pd.read_csv(csv_path, usecols=usecols, dtype=SCORE_DTYPES)
+    return _CSV_CACHE[key].copy(deep=False)
 
 
 def load_design_metrics(results_dir: Path) -> pd.DataFrame:
@@ -95,7 +285,7 @@ def load_design_metrics(results_dir: Path) -> pd.DataFrame:
 
     for csv_path in bindcraft_files:
         if csv_path.exists():
-            df = pd.read_csv(csv_path)
+            df = read_metrics_csv(csv_path)
             df = normalize_bindcraft_columns(df)
             print(f"Loaded BindCraft metrics from {csv_path} ({len(df)} designs)")
             return df
@@ -111,24 +301,27 @@ def load_design_metrics(results_dir: Path) -> pd.DataFrame:
     for name in possible_names:
         csv_path = results_dir / name
         if csv_path.exists():
-            df = pd.read_csv(csv_path)
+            df = read_metrics_csv(csv_path)
             df = normalize_column_names(df)
             print(f"Loaded metrics from {csv_path}")
             return df
 
-    # Try to find in subdirectories
-    for subdir in results_dir.iterdir():
-        if subdir.is_dir():
-            for name in possible_names + ["final_design_stats.csv", "mpnn_design_stats.csv"]:
-                csv_path = subdir / name
-                if csv_path.exists():
-                    df = pd.read_csv(csv_path)
-                    if 'Average_pLDDT' in df.columns or 'Average_i_pAE' in df.columns:
-                        df = normalize_bindcraft_columns(df)
-                    else:
-                        df = normalize_column_names(df)
-                    print(f"Loaded metrics from {csv_path}")
-                    return df
+    # Try to find in subdirectories; scandir reports entry types from the
+    # directory listing, so only the candidate probes below cost a stat
+    subdir_names = possible_names + ["final_design_stats.csv", "mpnn_design_stats.csv"]
+    with os.scandir(results_dir) as entries:
+        subdirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+    for subdir in subdirs:
+        for name in subdir_names:
+            csv_path = subdir / name
+            if csv_path.exists():
+                df = read_metrics_csv(csv_path)
+                if 'Average_pLDDT' in df.columns or 'Average_i_pAE' in df.columns:
+                    df = normalize_bindcraft_columns(df)
+                else:
+                    df = normalize_column_names(df)
+                print(f"Loaded metrics from {csv_path}")
+                return df
 
     print("No metrics file found, generating mock data for demonstration")
     return generate_mock_data()
@@ -136,39 +329,10 @@ def load_design_metrics(results_dir: Path) -> pd.DataFrame:
 
 def normalize_bindcraft_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize BindCraft column names to standard format."""
-    # BindCraft uses Average_pLDDT, Average_i_pAE, etc.
-    column_mapping = {
-        'Design': 'design_name',
-        'Rank': 'rank',
-        'Average_pLDDT': 'plddt',
-        'Average_pTM': 'ptm',
-        'Average_i_pTM': 'i_ptm',
-        'Average_pAE': 'pae',
-        'Average_i_pAE': 'i_pae',
-        'Average_i_pLDDT': 'i_plddt',
-        'Average_ss_pLDDT': 'ss_plddt',
-        'Average_dG': 'dG',
-        'Average_dSASA': 'dSASA',
-        'Average_ShapeComplementarity': 'shape_complementarity',
-        'Average_n_InterfaceResidues': 'n_interface_residues',
-        'Average_n_InterfaceHbonds': 'n_interface_hbonds',
-        'Length': 'length',
-        'Seed': 'seed',
-        'MPNN_score': 'mpnn_score',
-        'MPNN_seq_recovery': 'mpnn_seq_recovery',
-        # Also handle trajectory stats format (no Average_ prefix)
-        'pLDDT': 'plddt',
-        'pTM': 'ptm',
-        'i_pTM': 'i_ptm',
-        'i_pAE': 'i_pae',
-        'i_pLDDT': 'i_plddt',
-        'ss_pLDDT': 'ss_plddt',
-    }
-
     df = df.copy()
 
     # Rename columns
-    for old_name, new_name in column_mapping.items():
+    for old_name, new_name in BINDCRAFT_COLUMNS.items():
         if old_name in df.columns and new_name not in df.columns:
             df[new_name] = df[old_name]
 
@@ -196,22 +360,7 @@ def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize generic column names to standard format."""
     df = df.copy()
 
-    # Common variations
-    column_mapping = {
-        'design': 'design_name',
-        'name': 'design_name',
-        'pLDDT': 'plddt',
-        'PLDDT': 'plddt',
-        'pAE': 'pae',
-        'PAE': 'pae',
-        'interface_pae': 'i_pae',
-        'interface_plddt': 'i_plddt',
-        'interface_ptm': 'i_ptm',
-        'pTM': 'ptm',
-        'PTM': 'ptm',
-    }
-
-    for old_name, new_name in column_mapping.items():
+    for old_name, new_name in GENERIC_COLUMNS.items():
         if old_name in df.columns and new_name not in df.columns:
             df[new_name] = df[old_name]
 
@@ -246,123 +395,145 @@ def simplify_design_name(name: str) -> str:
     return name
 
 
+def sort_order(values: pd.Series, ascending: bool = True) -> np.ndarray:
+    """Positions that sort values in the same order as DataFrame.sort_values."""
+    return values.reset_index(drop=True).sort_values(ascending=ascending).index.to_numpy()
+
+
+def short_design_names(df: pd.DataFrame) -> pd.Series:
+    """Display names for the designs in df, aligned with its index.
+
+    Uses the '_short_name' column cached by the figure builders when present.
+    """
+    if '_short_name' in df.columns:
+        return df['_short_name']
+    return df['design_name'].map(simplify_design_name)
+
+
+def format_table_cells(df_sorted: pd.DataFrame, display_cols: list, formats: dict,
+                       default: str = '%.2f') -> list:
+    """Cell text for metrics table rows; display_cols[0] is the design name.
+
+    formats maps a metric column to its %-format, other columns use default.
+    Each column is formatted in one np.char.mod call.
+    """
+    columns = [short_design_names(df_sorted).tolist()]
+    for col in display_cols[1:]:
+        columns.append(np.char.mod(formats.get(col, default), df_sorted[col].to_numpy()).tolist())
+    return [list(row) for row in zip(*columns)]
+
+
 def generate_mock_data(n_designs=8) -> pd.DataFrame:
     """Generate mock data for demonstration."""
-    np.random.seed(42)
-
-    designs = []
-    for i in range(1, n_designs + 1):
-        designs.append({
-            'design_name': f'design_{i:03d}',
-            'plddt': np.random.normal(78, 8),
-            'pae': np.random.exponential(5) + 2,
-            'i_pae': np.random.exponential(6) + 3,
-            'i_ptm': np.random.beta(5, 3),
-            'i_plddt': np.random.normal(75, 10),
-            'ptm': np.random.beta(6, 3),
-        })
-
-    df = pd.DataFrame(designs)
-    # Clip values to reasonable ranges
-    df['plddt'] = df['plddt'].clip(50, 95)
-    df['pae'] = df['pae'].clip(2, 25)
-    df['i_pae'] = df['i_pae'].clip(3, 30)
-    df['i_ptm'] = df['i_ptm'].clip(0.2, 0.9)
-    df['i_plddt'] = df['i_plddt'].clip(45, 90)
-    df['ptm'] = df['ptm'].clip(0.3, 0.95)
+    rng = np.random.default_rng(42)
+    n = n_designs
 
-    return df
+    # Each metric is drawn as a whole column and clipped to a reasonable range
+    return pd.DataFrame({
+        'design_name': [f'design_{i:03d}' for i in range(1, n + 1)],
+        'plddt': np.clip(rng.normal(78, 8, n), 50, 95),
+        'pae': np.clip(rng.exponential(5, n) + 2, 2, 25),
+        'i_pae': np.clip(rng.exponential(6, n) + 3, 3, 30),
+        'i_ptm': np.clip(rng.beta(5, 3, n), 0.2, 0.9),
+        'i_plddt': np.clip(rng.normal(75, 10, n), 45, 90),
+        'ptm': np.clip(rng.beta(6, 3, n), 0.3, 0.95),
+    }).astype(dict.fromkeys(SCORE_COLUMNS, 'float32'))
+
+
+# Composite score weights; each metric is first normalized to 0-1 (higher is better)
+COMPOSITE_WEIGHTS = {'plddt': 0.3, 'pae': 0.2, 'i_pae': 0.3, 'i_ptm': 0.2}
 
 
 def calculate_composite_score(df: pd.DataFrame) -> pd.Series:
-    """Calculate composite quality score for ranking designs."""
-    # Normalize each metric to 0-1 scale (higher is better)
-    scores = pd.DataFrame()
+    """Calculate composite quality score for ranking designs.
 
-    # pLDDT: higher is better (0-100 scale)
-    if 'plddt' in df.columns:
-        scores['plddt'] = df['plddt'] / 100
+    Normalizes the available metrics in one (n, k) array and combines them
+    with a single weighted matrix product.
+    """
+    cols = [col for col in COMPOSITE_WEIGHTS if col in df.columns]
+    if not cols:
+        return pd.Series(0.0, index=df.index)
 
-    # pAE: lower is better (invert)
-    if 'pae' in df.columns:
-        scores['pae'] = 1 - (df['pae'] / 30).clip(0, 1)
+    scores = np.array(df[cols], dtype=np.float64)  # Always a copy; normalized in place
+    for j, col in enumerate(cols):
+        if col == 'plddt':
+            scores[:, j] /= 100  # pLDDT: 0-100 scale
+        elif col in ('pae', 'i_pae'):
+            # pAE: lower is better (invert)
+            np.clip(scores[:, j] / 30, 0, 1, out=scores[:, j])
+            np.subtract(1, scores[:, j], out=scores[:, j])
 
-    # i_pae: lower is better (invert)
-    if 'i_pae' in df.columns:
-        scores['i_pae'] = 1 - (df['i_pae'] / 30).clip(0, 1)
+    weights = np.array([COMPOSITE_WEIGHTS[col] for col in cols])
+    return pd.Series(scores @ weights / weights.sum(), index=df.index)
 
-    # i_ptm: higher is better
-    if 'i_ptm' in df.columns:
-        scores['i_ptm'] = df['i_ptm']
 
-    # Calculate weighted average
-    weights = {'plddt': 0.3, 'pae': 0.2, 'i_pae': 0.3, 'i_ptm': 0.2}
+# Quality colors indexed by threshold band: below acceptable, acceptable, good
+QUALITY_COLORS = np.array([CAT_PALETTE[3], CAT_PALETTE[1], CAT_PALETTE[2]])  # Red, orange, green
 
-    composite = pd.Series(0.0, index=df.index)
-    total_weight = 0
-    for col, weight in weights.items():
-        if col in scores.columns:
-            composite += scores[col] * weight
-            total_weight += weight
 
-    if total_weight > 0:
-        composite /= total_weight
+def _threshold_colors(values, threshold_good, threshold_acceptable, higher_is_better=True):
+    """Get an (N, 3) array of colors based on quality thresholds."""
+    values = np.asarray(values, dtype=float)
+    bins = np.array([threshold_acceptable, threshold_good], dtype=float)
+    if not higher_is_better:
+        # Negate so "<= threshold" becomes ">= -threshold" with increasing bins
+        values, bins = -values, -bins
+    bands = np.digitize(values, bins)
+    bands[np.isnan(values)] = 0  # Missing values fail every threshold
+    return QUALITY_COLORS[bands]
 
-    return composite
 
+def cycle_palette(n: int) -> np.ndarray:
+    """(n, 3) array of CAT_PALETTE colors, repeating the palette as needed."""
+    return CAT_PALETTE_RGB[np.arange(n) % len(CAT_PALETTE_RGB)]
 
-def get_color_for_value(value, threshold_good, threshold_acceptable, higher_is_better=True):
-    """Get color based on quality thresholds."""
-    if higher_is_better:
-        if value >= threshold_good:
-            return CAT_PALETTE[2]  # Green
-        elif value >= threshold_acceptable:
-            return CAT_PALETTE[1]  # Orange
-        else:
-            return CAT_PALETTE[3]  # Red
-    else:
-        if value <= threshold_good:
-            return CAT_PALETTE[2]  # Green
-        elif value <= threshold_acceptable:
-            return CAT_PALETTE[1]  # Orange
-        else:
-            return CAT_PALETTE[3]  # Red
 
+def _threshold_lines(ax, threshold_good, threshold_acceptable, labels=None):
+    """Draw dashed good/acceptable lines across ax as a single collection.
 
-def plot_plddt_comparison(df: pd.DataFrame, output_path: str = None):
+    With labels, empty proxy lines carry the legend entries.
+    """
+    colors = [CAT_PALETTE[2], CAT_PALETTE[1]]
+    segments = [[(0, y), (1, y)] for y in (threshold_good, threshold_acceptable)]
+    ax.add_collection(LineCollection(segments, colors=colors, linestyles='--', alpha=0.7,
+                                     linewidths=1, zorder=2, transform=ax.get_yaxis_transform()))
+    if labels:
+        for color, label in zip(colors, labels):
+            ax.plot([], [], color=color, linestyle='--', alpha=0.7, linewidth=1, label=label)
+
+
+def plot_plddt_comparison(df: pd.DataFrame, output_path: str = None, include_vector: bool = False,
+                          fig: plt.Figure = None, order: np.ndarray = None):
     """
     Plot 1: Bar chart comparing pLDDT scores across designs.
     """
-    fig, ax = simple_ax(figsize=FIGSIZE)
+    fig, ax = simple_ax(figsize=FIGSIZE, fig=fig)
 
     # Sort by pLDDT (descending)
-    df_sorted = df.sort_values('plddt', ascending=False).reset_index(drop=True)
+    df_sorted = (df.sort_values('plddt', ascending=False) if order is None else df.iloc[order]).reset_index(drop=True)
 
     n_designs = len(df_sorted)
     x_pos = np.arange(n_designs)
 
     # Color bars based on quality thresholds
-    colors = [get_color_for_value(v, QUALITY_THRESHOLDS['plddt_good'],
-                                   QUALITY_THRESHOLDS['plddt_acceptable'],
-                                   higher_is_better=True)
-              for v in df_sorted['plddt']]
+    colors = _threshold_colors(df_sorted['plddt'], QUALITY_THRESHOLDS['plddt_good'],
+                               QUALITY_THRESHOLDS['plddt_acceptable'], higher_is_better=True)
 
-    bars = ax.bar(x_pos, df_sorted['plddt'], color=colors, alpha=0.9, width=0.7)
+    bars = ax.bar(x_pos, df_sorted['plddt'], color=colors, alpha=0.9, width=0.7,
+                  rasterized=n_designs >= RASTERIZE_MIN_DESIGNS)
 
     # Add threshold lines
-    ax.axhline(y=QUALITY_THRESHOLDS['plddt_good'], color=CAT_PALETTE[2],
-               linestyle='--', alpha=0.7, linewidth=1, label=f"Good (>{QUALITY_THRESHOLDS['plddt_good']})")
-    ax.axhline(y=QUALITY_THRESHOLDS['plddt_acceptable'], color=CAT_PALETTE[1],
-               linestyle='--', alpha=0.7, linewidth=1, label=f"Acceptable (>{QUALITY_THRESHOLDS['plddt_acceptable']})")
+    _threshold_lines(ax, QUALITY_THRESHOLDS['plddt_good'], QUALITY_THRESHOLDS['plddt_acceptable'],
+                     labels=[f"Good (>{QUALITY_THRESHOLDS['plddt_good']})",
+                             f"Acceptable (>{QUALITY_THRESHOLDS['plddt_acceptable']})"])
 
     ax.set_title('Design pLDDT Scores', fontsize=12, fontweight='bold', pad=10)
     ax.set_ylabel('pLDDT', fontsize=10)
     ax.set_xlabel('Design', fontsize=10)
-    ax.set_xticks(x_pos)
 
     # Simplify labels
-    labels = [simplify_design_name(name) for name in df_sorted['design_name']]
-    ax.set_xticklabels(labels, fontsize=8, rotation=45, ha='right')
+    labels = short_design_names(df_sorted).tolist()
+    set_category_ticks(ax.xaxis, x_pos, labels, fontsize=8, rotation=45, ha='right')
 
     ax.set_ylim(0, 100)
     ax.yaxis.grid(True, linestyle='--', alpha=0.4)
@@ -371,17 +542,18 @@ def plot_plddt_comparison(df: pd.DataFrame, output_path: str = None):
     plt.tight_layout()
 
     if output_path:
-        save_for_pub(fig, output_path)
-        print(f"Saved: {output_path}.png, {output_path}.pdf")
+        saved = save_for_pub(fig, output_path, include_vector=include_vector)
+        print(f"Saved: {', '.join(saved)}")
 
     return fig
 
 
-def plot_interface_pae(df: pd.DataFrame, output_path: str = None):
+def plot_interface_pae(df: pd.DataFrame, output_path: str = None, include_vector: bool = False,
+                       fig: plt.Figure = None, order: np.ndarray = None):
     """
     Plot 2: Bar chart of interface pAE scores.
     """
-    fig, ax = simple_ax(figsize=FIGSIZE)
+    fig, ax = simple_ax(figsize=FIGSIZE, fig=fig)
 
     # Use i_pae if available, otherwise use pae
     pae_col = 'i_pae' if 'i_pae' in df.columns else 'pae'
@@ -389,31 +561,29 @@ def plot_interface_pae(df: pd.DataFrame, output_path: str = None):
     threshold_acc = QUALITY_THRESHOLDS['i_pae_acceptable'] if pae_col == 'i_pae' else QUALITY_THRESHOLDS['pae_acceptable']
 
     # Sort by pAE (ascending - lower is better)
-    df_sorted = df.sort_values(pae_col, ascending=True).reset_index(drop=True)
+    df_sorted = (df.sort_values(pae_col, ascending=True) if order is None else df.iloc[order]).reset_index(drop=True)
 
     n_designs = len(df_sorted)
     x_pos = np.arange(n_designs)
 
     # Color bars based on quality thresholds (lower is better)
-    colors = [get_color_for_value(v, threshold_good, threshold_acc, higher_is_better=False)
-              for v in df_sorted[pae_col]]
+    colors = _threshold_colors(df_sorted[pae_col], threshold_good, threshold_acc,
+                               higher_is_better=False)
 
-    bars = ax.bar(x_pos, df_sorted[pae_col], color=colors, alpha=0.9, width=0.7)
+    bars = ax.bar(x_pos, df_sorted[pae_col], color=colors, alpha=0.9, width=0.7,
+                  rasterized=n_designs >= RASTERIZE_MIN_DESIGNS)
 
     # Add threshold lines
-    ax.axhline(y=threshold_good, color=CAT_PALETTE[2],
-               linestyle='--', alpha=0.7, linewidth=1, label=f"Good (<{threshold_good})")
-    ax.axhline(y=threshold_acc, color=CAT_PALETTE[1],
-               linestyle='--', alpha=0.7, linewidth=1, label=f"Acceptable (<{threshold_acc})")
+    _threshold_lines(ax, threshold_good, threshold_acc,
+                     labels=[f"Good (<{threshold_good})", f"Acceptable (<{threshold_acc})"])
 
     title = 'Interface pAE Scores' if pae_col == 'i_pae' else 'pAE Scores'
     ax.set_title(title, fontsize=12, fontweight='bold', pad=10)
     ax.set_ylabel('pAE (lower is better)', fontsize=10)
     ax.set_xlabel('Design', fontsize=10)
-    ax.set_xticks(x_pos)
 
-    labels = [simplify_design_name(name) for name in df_sorted['design_name']]
-    ax.set_xticklabels(labels, fontsize=8, rotation=45, ha='right')
+    labels = short_design_names(df_sorted).tolist()
+    set_category_ticks(ax.xaxis, x_pos, labels, fontsize=8, rotation=45, ha='right')
 
     ax.yaxis.grid(True, linestyle='--', alpha=0.4)
     ax.legend(loc='upper right', fontsize=8)
@@ -421,17 +591,18 @@ def plot_interface_pae(df: pd.DataFrame, output_path: str = None):
     plt.tight_layout()
 
     if output_path:
-        save_for_pub(fig, output_path)
-        print(f"Saved: {output_path}.png, {output_path}.pdf")
+        saved = save_for_pub(fig, output_path, include_vector=include_vector)
+        print(f"Saved: {', '.join(saved)}")
 
     return fig
 
 
-def plot_metrics_table(df: pd.DataFrame, output_path: str = None):
+def plot_metrics_table(df: pd.DataFrame, output_path: str = None, include_vector: bool = False,
+                       scores: pd.Series = None, fig: plt.Figure = None, order: np.ndarray = None):
     """
     Plot 3: Table showing all metrics for each design.
     """
-    fig = plt.figure(figsize=FIGSIZE)
+    fig = new_figure(FIGSIZE, fig)
     ax = fig.add_subplot(111)
     ax.axis('off')
     ax.set_title('Design Metrics Summary', fontsize=12, fontweight='bold', pad=10)
@@ -445,61 +616,46 @@ def plot_metrics_table(df: pd.DataFrame, output_path: str = None):
     display_cols.extend(metric_cols)
 
     # Calculate composite score
-    df = df.copy()
-    df['score'] = calculate_composite_score(df)
+    if scores is None:
+        scores = calculate_composite_score(df)
     metric_cols.append('score')
     display_cols.append('score')
 
-    # Sort by composite score
-    df_sorted = df.sort_values('score', ascending=False).head(8).reset_index(drop=True)
+    # Sort by composite score; only the rows shown in the table are copied
+    top = (sort_order(scores, ascending=False) if order is None else np.asarray(order))[:8]
+    df_sorted = df.iloc[top].assign(score=scores.to_numpy()[top]).reset_index(drop=True)
 
-    n_rows = len(df_sorted) + 1  # +1 for header
     n_cols = len(display_cols)
 
+    # Format every cell up front and hand the text to the table in one go
+    cell_text = format_table_cells(df_sorted, display_cols,
+                                   {'plddt': '%.1f', 'i_plddt': '%.1f', 'pae': '%.1f', 'i_pae': '%.1f'})
+    header_labels = ['Design', 'pLDDT', 'pAE', 'i_pAE', 'i_pTM', 'pTM', 'Score'][:n_cols]
     table = ax.table(
-        cellText=[['']*n_cols for _ in range(n_rows)],
+        cellText=cell_text,
+        colLabels=header_labels,
         loc='center',
         cellLoc='center',
         bbox=[0.0, 0.05, 1.0, 0.9]
     )
+    table.auto_set_font_size(False)
+    table.set_fontsize(8)
 
     # Style header
-    header_labels = ['Design', 'pLDDT', 'pAE', 'i_pAE', 'i_pTM', 'pTM', 'Score'][:n_cols]
-    for j, label in enumerate(header_labels):
+    for j in range(n_cols):
         cell = table[(0, j)]
-        cell.set_text_props(text=label, fontweight='bold', fontsize=8)
+        cell.get_text().set_fontweight('bold')
         cell.set_facecolor('#E8E8E8')
 
-    # Fill data
-    for i, (_, row) in enumerate(df_sorted.iterrows()):
-        for j, col in enumerate(display_cols):
-            cell = table[(i+1, j)]
-            val = row[col]
-            if col == 'design_name':
-                text = simplify_design_name(val)
-            elif col == 'score':
-                text = f'{val:.2f}'
-            elif col in ['plddt', 'i_plddt']:
-                text = f'{val:.1f}'
-            elif col in ['pae', 'i_pae']:
-                text = f'{val:.1f}'
-            elif col in ['ptm', 'i_ptm']:
-                text = f'{val:.2f}'
-            else:
-                text = f'{val:.2f}'
-            cell.set_text_props(text=text, fontsize=8)
-
-            # Highlight best score row
-            if i == 0 and col == 'score':
-                cell.set_facecolor('#D4EDDA')  # Light green
+    # Highlight best score
+    table[(1, n_cols - 1)].set_facecolor('#D4EDDA')  # Light green
 
-    table.auto_set_font_size(False)
     for key, cell in table.get_celld().items():
         cell.set_edgecolor('#CCCCCC')
         cell.set_height(0.1)
 
     # Add best design annotation
-    best_design = simplify_design_name(df_sorted.iloc[0]['design_name'])
+    best_design = cell_text[0][0]
     best_score = df_sorted.iloc[0]['score']
     ax.text(0.5, 0.01, f'Best: Design {best_design} (score={best_score:.2f})',
             ha='center', va='bottom', transform=ax.transAxes, fontsize=9, fontweight='bold')
@@ -507,27 +663,30 @@ def plot_metrics_table(df: pd.DataFrame, output_path: str = None):
     plt.tight_layout()
 
     if output_path:
-        save_for_pub(fig, output_path)
-        print(f"Saved: {output_path}.png, {output_path}.pdf")
+        saved = save_for_pub(fig, output_path, include_vector=include_vector)
+        print(f"Saved: {', '.join(saved)}")
 
     return fig
 
 
-def plot_quality_scatter(df: pd.DataFrame, output_path: str = None):
+def plot_quality_scatter(df: pd.DataFrame, output_path: str = None, include_vector: bool = False,
+                         scores: pd.Series = None, fig: plt.Figure = None):
     """
     Plot 4: Scatter plot of pLDDT vs pAE with quality zones.
     """
-    fig, ax = simple_ax(figsize=FIGSIZE)
+    fig, ax = simple_ax(figsize=FIGSIZE, fig=fig)
 
     pae_col = 'i_pae' if 'i_pae' in df.columns else 'pae'
     pae_good = QUALITY_THRESHOLDS['i_pae_good'] if pae_col == 'i_pae' else QUALITY_THRESHOLDS['pae_good']
 
     # Calculate composite scores for coloring
-    scores = calculate_composite_score(df)
+    if scores is None:
+        scores = calculate_composite_score(df)
 
     # Scatter plot
     scatter = ax.scatter(df['plddt'], df[pae_col], c=scores, cmap='viridis',
-                        s=80, alpha=0.8, edgecolors='white', linewidth=0.5)
+                        s=80, alpha=0.8, edgecolors='white', linewidth=0.5,
+                        rasterized=len(df) >= RASTERIZE_MIN_DESIGNS)
 
     # Add quality zone rectangles
     # Good zone (top-left: high pLDDT, low pAE)
@@ -543,11 +702,11 @@ def plot_quality_scatter(df: pd.DataFrame, output_path: str = None):
                linestyle='--', alpha=0.5, linewidth=1)
 
     # Add design labels
-    for i, row in df.iterrows():
-        label = simplify_design_name(row['design_name'])
-        ax.annotate(label, (row['plddt'], row[pae_col]),
-                   fontsize=7, alpha=0.7,
-                   xytext=(3, 3), textcoords='offset points')
+    if len(df) <= ANNOTATE_MAX_DESIGNS:
+        for x, y, label in zip(df['plddt'].to_numpy(), df[pae_col].to_numpy(), short_design_names(df)):
+            ax.annotate(label, (x, y),
+                        fontsize=7, alpha=0.7,
+                        xytext=(3, 3), textcoords='offset points')
 
     ax.set_title('Quality Distribution', fontsize=12, fontweight='bold', pad=10)
     ax.set_xlabel('pLDDT (higher is better)', fontsize=10)
@@ -567,69 +726,104 @@ def plot_quality_scatter(df: pd.DataFrame, output_path: str = None):
     plt.tight_layout()
 
     if output_path:
-        save_for_pub(fig, output_path)
-        print(f"Saved: {output_path}.png, {output_path}.pdf")
+        saved = save_for_pub(fig, output_path, include_vector=include_vector)
+        print(f"Saved: {', '.join(saved)}")
 
     return fig
 
 
-def plot_design_ranking(df: pd.DataFrame, output_path: str = None):
+def plot_design_ranking(df: pd.DataFrame, output_path: str = None, include_vector: bool = False,
+                        scores: pd.Series = None, fig: plt.Figure = None, order: np.ndarray = None):
     """
     Plot 5: Horizontal bar chart ranking designs by composite score.
     """
-    fig, ax = simple_ax(figsize=FIGSIZE)
+    fig, ax = simple_ax(figsize=FIGSIZE, fig=fig)
 
     # Calculate composite scores and sort
-    df = df.copy()
-    df['score'] = calculate_composite_score(df)
-    df_sorted = df.sort_values('score', ascending=True).reset_index(drop=True)
-
-    n_designs = len(df_sorted)
+    if scores is None:
+        scores = calculate_composite_score(df)
+    if order is None:
+        order = sort_order(scores)
+    scores_sorted = scores.to_numpy()[order]
+    names_sorted = short_design_names(df).to_numpy()[order]
+
+    n_designs = len(scores_sorted)
     y_pos = np.arange(n_designs)
 
     # Use sequential palette for ranking
-    colors = [CAT_PALETTE[i % len(CAT_PALETTE)] for i in range(n_designs)]
-    colors = colors[::-1]  # Reverse so best is at top
+    colors = cycle_palette(n_designs)[::-1]  # Reverse so best is at top
 
-    bars = ax.barh(y_pos, df_sorted['score'], color=colors, alpha=0.9, height=0.7)
+    bars = ax.barh(y_pos, scores_sorted, color=colors, alpha=0.9, height=0.7,
+                   rasterized=n_designs >= RASTERIZE_MIN_DESIGNS)
 
     ax.set_title('Design Ranking', fontsize=12, fontweight='bold', pad=10)
     ax.set_xlabel('Composite Score', fontsize=10)
-    ax.set_yticks(y_pos)
 
     # Labels with rank
-    labels = []
-    for i, (_, row) in enumerate(df_sorted.iterrows()):
-        rank = n_designs - i
-        name = simplify_design_name(row['design_name'])
-        labels.append(f"#{rank}: {name}")
-    ax.set_yticklabels(labels, fontsize=9)
+    labels = [f"#{n_designs - i}: {name}" for i, name in enumerate(names_sorted)]
+    set_category_ticks(ax.yaxis, y_pos, labels, fontsize=9)
 
     ax.set_xlim(0, 1)
     ax.xaxis.grid(True, linestyle='--', alpha=0.4)
 
     # Add score labels on bars
-    for bar, (_, row) in zip(bars, df_sorted.iterrows()):
+    for bar, score in zip(bars, scores_sorted):
         width = bar.get_width()
         ax.text(width + 0.02, bar.get_y() + bar.get_height()/2,
-                f'{row["score"]:.2f}', va='center', fontsize=8)
+                f'{score:.2f}', va='center', fontsize=8)
 
     plt.tight_layout()
 
     if output_path:
-        save_for_pub(fig, output_path)
-        print(f"Saved: {output_path}.png, {output_path}.pdf")
+        saved = save_for_pub(fig, output_path, include_vector=include_vector)
+        print(f"Saved: {', '.join(saved)}")
 
     return fig
 
 
+def _glob_regex(pattern: str):
+    """Translate a glob pattern over '/'-separated relative paths to a regex.
+
+    As with glob.glob(recursive=True), '*' stays within one path segment and
+    a '**' segment spans any number of directories, including none.
+    """
+    regex = ''
+    for segment in pattern.split('/'):
+        if segment == '**':
+            regex += '(?:[^/]+/)*'
+        else:
+            regex += re.escape(segment).replace(r'\*', '[^/]*').replace(r'\?', '[^/]') + '/'
+    return regex[:-1]
+
+
+def _walk_mtimes(root, prefix=''):
+    """Yield (relative path, mtime) for every file and directory under root.
+
+    One os.scandir pass with a single stat per entry. Hidden entries are
+    skipped, as glob wildcards skip them.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            rel = prefix + entry.name
+            try:
+                yield rel, entry.stat().st_mtime
+            except OSError:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_mtimes(entry.path, rel + '/')
+
+
 def infer_timeline_from_files(results_dir: Path) -> list:
     """
     Infer execution timeline from file modification timestamps.
     Returns list of steps with start times and durations in minutes.
     """
-    import glob
-
     # Define files to check for each step
     step_files = {
         'Config': ['config.json', '*.json'],
@@ -639,31 +833,27 @@ def infer_timeline_from_files(results_dir: Path) -> list:
         'Analysis': ['design_metrics.csv', 'metrics.csv', '*_metrics.csv'],
         'Plot': ['binder_design_*.png', '*_summary.png']
     }
+    step_regexes = {step: re.compile('(?:' + '|'.join(_glob_regex(p) for p in patterns) + r')\Z')
+                    for step, patterns in step_files.items()}
 
+    # Walk the results tree once, keeping the earliest and latest mtime per step
     step_times = {}
-
-    for step_name, patterns in step_files.items():
-        times = []
-        for pattern in patterns:
-            matches = glob.glob(str(results_dir / pattern), recursive=True)
-            for match in matches:
-                try:
-                    mtime = os.path.getmtime(match)
-                    times.append(mtime)
-                except:
-                    pass
-        if times:
-            step_times[step_name] = {
-                'start': min(times),
-                'end': max(times)
-            }
+    for rel, mtime in _walk_mtimes(results_dir):
+        for step_name, regex in step_regexes.items():
+            if regex.match(rel):
+                times = step_times.get(step_name)
+                if times is None:
+                    step_times[step_name] = {'start': mtime, 'end': mtime}
+                else:
+                    times['start'] = min(times['start'], mtime)
+                    times['end'] = max(times['end'], mtime)
 
     if not step_times:
         return None
 
-    # Convert to relative times in minutes
-    all_times = [t['start'] for t in step_times.values()] + [t['end'] for t in step_times.values()]
-    base_time = min(all_times)
+    # Convert to relative times in minutes; every step starts no later than
+    # it ends, so the earliest start is the earliest time overall
+    base_time = min(times['start'] for times in step_times.values())
 
     steps = []
     step_order = ['Config', 'RFdiffusion', 'ProteinMPNN', 'AlphaFold2', 'Analysis', 'Plot']
@@ -682,29 +872,98 @@ def infer_timeline_from_files(results_dir: Path) -> list:
     return steps if steps else None
 
 
-def plot_execution_timeline(timeline_path: Path, results_dir: Path = None, output_path: str = None):
+# Typical binder design run (name, start, duration in minutes), shown when
+# neither a timeline JSON nor output file timestamps are available
+DEFAULT_TIMELINE = (
+    ('Config', 0, 1),
+    ('RFdiffusion', 1, 30),
+    ('ProteinMPNN', 31, 5),
+    ('AlphaFold2', 36, 20),
+    ('Analysis', 56, 2),
+    ('Plot', 58, 1),
+)
+DEFAULT_STEP_NAMES = tuple(name for name, _, _ in DEFAULT_TIMELINE)
+DEFAULT_STEP_STARTS = np.array([start for _, start, _ in DEFAULT_TIMELINE], dtype=float)
+DEFAULT_STEP_DURATIONS = np.array([duration for _, _, duration in DEFAULT_TIMELINE], dtype=float)
+DEFAULT_STEP_STARTS.flags.writeable = False
+DEFAULT_STEP_DURATIONS.flags.writeable = False
+
+
+def step_spans(steps):
+    """Start and duration arrays (minutes) for a list of timeline step dicts."""
+    starts = np.array([s['start'] for s in steps], dtype=float)
+    durations = np.array([s['duration'] for s in steps], dtype=float)
+    return starts, durations
+
+
+def _timeline_bars(starts, durations, y_positions, colors, height=0.6) -> PolyCollection:
+    """All step bars of a Gantt chart as one PolyCollection."""
+    ends = starts + durations
+    bottom = np.asarray(y_positions, dtype=float) - height / 2
+    top = bottom + height
+    verts = np.stack([np.column_stack(corner) for corner in
+                      ((starts, bottom), (ends, bottom), (ends, top), (starts, top))], axis=1)
+    return PolyCollection(verts, facecolors=colors, edgecolors='white', linewidths=0.5)
+
+
+def _dir_mtimes(root, prefix=''):
+    """Yield (relative path, st_mtime_ns) for root and every directory below it.
+
+    Only directories are stat'ed; hidden ones are skipped, as in _walk_mtimes.
+    """
+    try:
+        yield prefix, os.stat(root).st_mtime_ns
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if not entry.name.startswith('.') and entry.is_dir(follow_symlinks=False):
+                yield from _dir_mtimes(entry.path, prefix + entry.name + '/')
+
+
+@functools.lru_cache(maxsize=8)
+def _inferred_timeline(results_dir: str, dir_mtimes: tuple) -> tuple:
+    steps = infer_timeline_from_files(Path(results_dir))
+    return tuple(tuple(step.items()) for step in steps or ())
+
+
+def cached_timeline_from_files(results_dir: Path) -> list:
+    """infer_timeline_from_files, reused while no directory in the tree changes.
+
+    The cache key holds the mtime of results_dir and of each subdirectory, so
+    a step that adds files anywhere in the tree (e.g. */seqs/*.fa) invalidates
+    the cached walk. Rewriting an existing file in place does not.
+    """
+    results_dir = Path(results_dir)
+    dir_mtimes = tuple(_dir_mtimes(results_dir))
+    if not dir_mtimes:
+        return None
+    steps = _inferred_timeline(str(results_dir.resolve()), dir_mtimes)
+    return [dict(step) for step in steps] or None
+
+
+def read_json(path: Path):
+    """Parse a JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def plot_execution_timeline(timeline_path: Path, results_dir: Path = None, output_path: str = None,
+                            include_vector: bool = False, fig: plt.Figure = None):
     """
     Plot 6: Gantt chart of execution timeline.
     """
-    fig, ax = simple_ax(figsize=FIGSIZE)
+    fig, ax = simple_ax(figsize=FIGSIZE, fig=fig)
     ax.set_title('Execution Timeline', fontsize=12, fontweight='bold', pad=10)
 
-    # Default timeline for binder design
-    default_steps = [
-        {'name': 'Config', 'start': 0, 'duration': 1},
-        {'name': 'RFdiffusion', 'start': 1, 'duration': 30},
-        {'name': 'ProteinMPNN', 'start': 31, 'duration': 5},
-        {'name': 'AlphaFold2', 'start': 36, 'duration': 20},
-        {'name': 'Analysis', 'start': 56, 'duration': 2},
-        {'name': 'Plot', 'start': 58, 'duration': 1},
-    ]
-
     steps = None
 
     # Priority 1: Load from timeline JSON if exists
     if timeline_path is not None and timeline_path.exists():
-        with open(timeline_path) as f:
-            loaded_data = json.load(f)
+        loaded_data = read_json(timeline_path)
 
         steps = []
         for step in loaded_data:
@@ -725,32 +984,34 @@ def plot_execution_timeline(timeline_path: Path, results_dir: Path = None, outpu
 
     # Priority 2: Infer from file timestamps
     if steps is None and results_dir is not None:
-        inferred_steps = infer_timeline_from_files(results_dir)
+        inferred_steps = cached_timeline_from_files(results_dir)
         if inferred_steps:
-            total_inferred = max(s['start'] + s['duration'] for s in inferred_steps)
+            total_inferred = float(np.add(*step_spans(inferred_steps)).max())
             if total_inferred <= 1440:  # 24 hours in minutes
                 steps = inferred_steps
                 print(f"Inferred timeline from file timestamps (total: {total_inferred:.1f} min)")
 
     # Priority 3: Use defaults
     if steps is None:
-        steps = default_steps
+        names, starts, durations = DEFAULT_STEP_NAMES, DEFAULT_STEP_STARTS, DEFAULT_STEP_DURATIONS
         print("Using default timeline (no timing data available)")
+    else:
+        names = [step['name'] for step in steps]
+        starts, durations = step_spans(steps)
 
     # Calculate total time
-    total_time = max(s['start'] + s['duration'] for s in steps)
+    n_steps = len(names)
+    total_time = float((starts + durations).max())
 
     # Use colorblind palette for timeline bars
-    colors = [CAT_PALETTE[i % len(CAT_PALETTE)] for i in range(len(steps))]
-
-    y_positions = list(range(len(steps)-1, -1, -1))
+    colors = cycle_palette(n_steps)
 
-    for i, (step, y_pos) in enumerate(zip(steps, y_positions)):
-        ax.barh(y_pos, step['duration'], left=step['start'], height=0.6,
-                color=colors[i], edgecolor='white', linewidth=0.5)
+    y_positions = list(range(n_steps-1, -1, -1))
 
-        # Add step label
-        ax.text(-0.5, y_pos, f"Step {i+1}:\n{step['name']}", ha='right', va='center',
+    # One collection for all step bars, then the labels
+    ax.add_collection(_timeline_bars(starts, durations, y_positions, colors))
+    for i, (name, y_pos) in enumerate(zip(names, y_positions)):
+        ax.text(-0.5, y_pos, f"Step {i+1}:\n{name}", ha='right', va='center',
                 fontsize=8)
 
     # Add total time bar
@@ -760,7 +1021,7 @@ def plot_execution_timeline(timeline_path: Path, results_dir: Path = None, outpu
 
     ax.set_xlabel('Time (minutes)', fontsize=10)
     ax.set_xlim(-1, total_time * 1.1)
-    ax.set_ylim(-2, len(steps))
+    ax.set_ylim(-2, n_steps)
     ax.set_yticks([])
     ax.xaxis.grid(True, linestyle='--', alpha=0.4)
 
@@ -770,19 +1031,54 @@ def plot_execution_timeline(timeline_path: Path, results_dir: Path = None, outpu
     plt.tight_layout()
 
     if output_path:
-        save_for_pub(fig, output_path)
-        print(f"Saved: {output_path}.png, {output_path}.pdf")
+        saved = save_for_pub(fig, output_path, include_vector=include_vector)
+        print(f"Saved: {', '.join(saved)}")
 
     return fig
 
 
-def create_separate_figures(results_dir: str, output_prefix: str = None):
+# Individual figures drawn from the metrics table: (file suffix, plot function),
+# in output order; the execution timeline follows them
+FIGURES = [
+    ('plddt_comparison', plot_plddt_comparison),
+    ('interface_pae', plot_interface_pae),
+    ('metrics_table', plot_metrics_table),
+    ('quality_scatter', plot_quality_scatter),
+    ('design_ranking', plot_design_ranking),
+]
+
+# Worker processes for rendering figures in parallel
+WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _draw_figure(suffix: str, df: pd.DataFrame, output_path: str, include_vector: bool,
+                 kwargs: dict, fig: plt.Figure = None) -> plt.Figure:
+    """Build and save one individual figure, reusing `fig` if given."""
+    if suffix == 'execution_timeline':
+        return plot_execution_timeline(output_path=output_path, include_vector=include_vector,
+                                       fig=fig, **kwargs)
+    return dict(FIGURES)[suffix](df, output_path, include_vector, fig=fig, **kwargs)
+
+
+def _render_figure(suffix: str, df: pd.DataFrame, output_path: str, include_vector: bool,
+                   kwargs: dict) -> str:
+    """Process-pool worker: build, save and close one individual figure."""
+    set_pub_plot_context(context="talk")
+    plt.close(_draw_figure(suffix, df, output_path, include_vector, kwargs))
+    return f"{output_path}.png"
+
+
+def create_separate_figures(results_dir: str, output_prefix: str = None, include_vector: bool = False,
+                            parallel: bool = True):
     """
     Create separate visualization figures for binder design.
 
     Args:
         results_dir: Path to results directory
         output_prefix: Path prefix for saving (without extension)
+        include_vector: Also write a PDF next to each PNG
+        parallel: If True, render figures in a process pool (one figure per
+            job) when more than one CPU is available
 
     Returns:
         list: Paths to saved figures
@@ -802,38 +1098,44 @@ def create_separate_figures(results_dir: str, output_prefix: str = None):
         print("Error: No design metrics found in", results_dir)
         return None
 
-    saved_files = []
-
-    # Figure 1: pLDDT comparison
-    fig1 = plot_plddt_comparison(df, f"{output_prefix}_plddt_comparison")
-    saved_files.append(f"{output_prefix}_plddt_comparison.png")
-    plt.close(fig1)
-
-    # Figure 2: Interface pAE
-    fig2 = plot_interface_pae(df, f"{output_prefix}_interface_pae")
-    saved_files.append(f"{output_prefix}_interface_pae.png")
-    plt.close(fig2)
-
-    # Figure 3: Metrics table
-    fig3 = plot_metrics_table(df, f"{output_prefix}_metrics_table")
-    saved_files.append(f"{output_prefix}_metrics_table.png")
-    plt.close(fig3)
-
-    # Figure 4: Quality scatter
-    fig4 = plot_quality_scatter(df, f"{output_prefix}_quality_scatter")
-    saved_files.append(f"{output_prefix}_quality_scatter.png")
-    plt.close(fig4)
+    # Composite score shared by the table, scatter and ranking figures
+    scores = calculate_composite_score(df)
+    df['_short_name'] = short_design_names(df)
 
-    # Figure 5: Design ranking
-    fig5 = plot_design_ranking(df, f"{output_prefix}_design_ranking")
-    saved_files.append(f"{output_prefix}_design_ranking.png")
-    plt.close(fig5)
+    # Sort each ranking once; the plots take rows in these orders
+    pae_col = 'i_pae' if 'i_pae' in df.columns else 'pae'
+    order_plddt = sort_order(df['plddt'], ascending=False)
+    order_pae = sort_order(df[pae_col])
+    order_score = sort_order(scores, ascending=False)
+
+    # Extra inputs per figure, in output order
+    jobs = [
+        ('plddt_comparison', {'order': order_plddt}),
+        ('interface_pae', {'order': order_pae}),
+        ('metrics_table', {'scores': scores, 'order': order_score}),
+        ('quality_scatter', {'scores': scores}),
+        ('design_ranking', {'scores': scores, 'order': sort_order(scores)}),
+        ('execution_timeline', {'timeline_path': results_dir / "execution_timeline.json",
+                                'results_dir': results_dir}),
+    ]
 
-    # Figure 6: Execution timeline
-    timeline_path = results_dir / "execution_timeline.json"
-    fig6 = plot_execution_timeline(timeline_path, results_dir, f"{output_prefix}_execution_timeline")
-    saved_files.append(f"{output_prefix}_execution_timeline.png")
-    plt.close(fig6)
+    if parallel and WORKERS > 1:
+        # Figures are independent, so each one is built and saved in its own process
+        with ProcessPoolExecutor(max_workers=min(WORKERS, len(jobs))) as pool:
+            futures = [pool.submit(_render_figure, suffix, df, f"{output_prefix}_{suffix}",
+                                   include_vector, kwargs)
+                       for suffix, kwargs in jobs]
+            saved_files = [future.result() for future in futures]
+    else:
+        # Single process: each figure is saved as soon as it is drawn, so all
+        # six reuse one Figure
+        saved_files = []
+        fig = None
+        for suffix, kwargs in jobs:
+            path = f"{output_prefix}_{suffix}"
+            fig = _draw_figure(suffix, df, path, include_vector, kwargs, fig)
+            saved_files.append(f"{path}.png")
+        plt.close(fig)
 
     print(f"\nGenerated {len(saved_files)} separate figures:")
     for f in saved_files:
@@ -842,7 +1144,7 @@ def create_separate_figures(results_dir: str, output_prefix: str = None):
     return saved_files
 
 
-def create_merged_figure(results_dir: str, output_prefix: str = None):
+def create_merged_figure(results_dir: str, output_prefix: str = None, include_vector: bool = False):
     """
     Create a single merged figure with all panels.
 
@@ -853,6 +1155,7 @@ def create_merged_figure(results_dir: str, output_prefix: str = None):
     Args:
         results_dir: Path to results directory
         output_prefix: Path prefix for saving (without extension)
+        include_vector: Also write a PDF next to the PNG
 
     Returns:
         str: Path to saved merged figure
@@ -872,6 +1175,16 @@ def create_merged_figure(results_dir: str, output_prefix: str = None):
         print("Error: No design metrics found in", results_dir)
         return None
 
+    # Composite score shared by the scatter, ranking and table panels
+    scores = calculate_composite_score(df)
+    df['_short_name'] = short_design_names(df)
+
+    # Sort each ranking once; the plots take rows in these orders
+    pae_col = 'i_pae' if 'i_pae' in df.columns else 'pae'
+    order_plddt = sort_order(df['plddt'], ascending=False)
+    order_pae = sort_order(df[pae_col])
+    order_score = sort_order(scores, ascending=False)
+
     # Create figure with 2x3 grid
     fig = plt.figure(figsize=(12, 8))
 
@@ -889,11 +1202,11 @@ def create_merged_figure(results_dir: str, output_prefix: str = None):
     prettify_ax(ax6)
 
     # Generate plots on axes
-    _plot_plddt_comparison_ax(ax1, df)
-    _plot_interface_pae_ax(ax2, df)
-    _plot_quality_scatter_ax(ax3, df)
-    _plot_design_ranking_ax(ax4, df)
-    _plot_metrics_table_ax(ax5, df)
+    _plot_plddt_comparison_ax(ax1, df, order_plddt)
+    _plot_interface_pae_ax(ax2, df, order_pae)
+    _plot_quality_scatter_ax(ax3, df, scores)
+    _plot_design_ranking_ax(ax4, df, scores, sort_order(scores))
+    _plot_metrics_table_ax(ax5, df, scores, order_score)
 
     timeline_path = results_dir / "execution_timeline.json"
     _plot_execution_timeline_ax(ax6, timeline_path, results_dir)
@@ -901,79 +1214,73 @@ def create_merged_figure(results_dir: str, output_prefix: str = None):
     plt.tight_layout()
 
     # Save figures
-    save_for_pub(fig, output_prefix, include_raster=True)
+    saved = save_for_pub(fig, output_prefix, include_raster=True, include_vector=include_vector)
 
     plt.close(fig)
 
-    print(f"\nSaved merged figure: {output_prefix}.png, {output_prefix}.pdf")
+    print(f"\nSaved merged figure: {', '.join(saved)}")
 
     return f"{output_prefix}.png"
 
 
 # Internal functions for merged figure (take ax parameter)
-def _plot_plddt_comparison_ax(ax, df):
+def _plot_plddt_comparison_ax(ax, df, order=None):
     """Internal: Plot pLDDT comparison on given axis."""
-    df_sorted = df.sort_values('plddt', ascending=False).reset_index(drop=True)
+    df_sorted = (df.sort_values('plddt', ascending=False) if order is None else df.iloc[order]).reset_index(drop=True)
     n_designs = len(df_sorted)
     x_pos = np.arange(n_designs)
 
-    colors = [get_color_for_value(v, QUALITY_THRESHOLDS['plddt_good'],
-                                   QUALITY_THRESHOLDS['plddt_acceptable'],
-                                   higher_is_better=True)
-              for v in df_sorted['plddt']]
+    colors = _threshold_colors(df_sorted['plddt'], QUALITY_THRESHOLDS['plddt_good'],
+                               QUALITY_THRESHOLDS['plddt_acceptable'], higher_is_better=True)
 
-    ax.bar(x_pos, df_sorted['plddt'], color=colors, alpha=0.9, width=0.7)
-    ax.axhline(y=QUALITY_THRESHOLDS['plddt_good'], color=CAT_PALETTE[2],
-               linestyle='--', alpha=0.7, linewidth=1)
-    ax.axhline(y=QUALITY_THRESHOLDS['plddt_acceptable'], color=CAT_PALETTE[1],
-               linestyle='--', alpha=0.7, linewidth=1)
+    ax.bar(x_pos, df_sorted['plddt'], color=colors, alpha=0.9, width=0.7,
+           rasterized=n_designs >= RASTERIZE_MIN_DESIGNS)
+    _threshold_lines(ax, QUALITY_THRESHOLDS['plddt_good'], QUALITY_THRESHOLDS['plddt_acceptable'])
 
     ax.set_title('Design pLDDT Scores', fontsize=10, fontweight='bold', pad=8)
     ax.set_ylabel('pLDDT', fontsize=9)
     ax.set_xlabel('Design', fontsize=9)
-    ax.set_xticks(x_pos)
-    labels = [simplify_design_name(name) for name in df_sorted['design_name']]
-    ax.set_xticklabels(labels, fontsize=8)
+    set_category_ticks(ax.xaxis, x_pos, short_design_names(df_sorted).tolist(), fontsize=8)
     ax.set_ylim(0, 100)
     ax.yaxis.grid(True, linestyle='--', alpha=0.4)
 
 
-def _plot_interface_pae_ax(ax, df):
+def _plot_interface_pae_ax(ax, df, order=None):
     """Internal: Plot interface pAE on given axis."""
     pae_col = 'i_pae' if 'i_pae' in df.columns else 'pae'
     threshold_good = QUALITY_THRESHOLDS['i_pae_good'] if pae_col == 'i_pae' else QUALITY_THRESHOLDS['pae_good']
     threshold_acc = QUALITY_THRESHOLDS['i_pae_acceptable'] if pae_col == 'i_pae' else QUALITY_THRESHOLDS['pae_acceptable']
 
-    df_sorted = df.sort_values(pae_col, ascending=True).reset_index(drop=True)
+    df_sorted = (df.sort_values(pae_col, ascending=True) if order is None else df.iloc[order]).reset_index(drop=True)
     n_designs = len(df_sorted)
     x_pos = np.arange(n_designs)
 
-    colors = [get_color_for_value(v, threshold_good, threshold_acc, higher_is_better=False)
-              for v in df_sorted[pae_col]]
+    colors = _threshold_colors(df_sorted[pae_col], threshold_good, threshold_acc,
+                               higher_is_better=False)
 
-    ax.bar(x_pos, df_sorted[pae_col], color=colors, alpha=0.9, width=0.7)
-    ax.axhline(y=threshold_good, color=CAT_PALETTE[2], linestyle='--', alpha=0.7, linewidth=1)
-    ax.axhline(y=threshold_acc, color=CAT_PALETTE[1], linestyle='--', alpha=0.7, linewidth=1)
+    ax.bar(x_pos, df_sorted[pae_col], color=colors, alpha=0.9, width=0.7,
+           rasterized=n_designs >= RASTERIZE_MIN_DESIGNS)
+    _threshold_lines(ax, threshold_good, threshold_acc)
 
     title = 'Interface pAE Scores' if pae_col == 'i_pae' else 'pAE Scores'
     ax.set_title(title, fontsize=10, fontweight='bold', pad=8)
     ax.set_ylabel('pAE (lower is better)', fontsize=9)
     ax.set_xlabel('Design', fontsize=9)
-    ax.set_xticks(x_pos)
-    labels = [simplify_design_name(name) for name in df_sorted['design_name']]
-    ax.set_xticklabels(labels, fontsize=8)
+    set_category_ticks(ax.xaxis, x_pos, short_design_names(df_sorted).tolist(), fontsize=8)
     ax.yaxis.grid(True, linestyle='--', alpha=0.4)
 
 
-def _plot_quality_scatter_ax(ax, df):
+def _plot_quality_scatter_ax(ax, df, scores=None):
     """Internal: Plot quality scatter on given axis."""
     pae_col = 'i_pae' if 'i_pae' in df.columns else 'pae'
     pae_good = QUALITY_THRESHOLDS['i_pae_good'] if pae_col == 'i_pae' else QUALITY_THRESHOLDS['pae_good']
 
-    scores = calculate_composite_score(df)
+    if scores is None:
+        scores = calculate_composite_score(df)
 
     scatter = ax.scatter(df['plddt'], df[pae_col], c=scores, cmap='viridis',
-                        s=60, alpha=0.8, edgecolors='white', linewidth=0.5)
+                        s=60, alpha=0.8, edgecolors='white', linewidth=0.5,
+                        rasterized=len(df) >= RASTERIZE_MIN_DESIGNS)
 
     rect_good = Rectangle((QUALITY_THRESHOLDS['plddt_good'], 0),
                           100 - QUALITY_THRESHOLDS['plddt_good'], pae_good,
@@ -993,35 +1300,34 @@ def _plot_quality_scatter_ax(ax, df):
     cbar.set_label('Score', fontsize=8)
 
 
-def _plot_design_ranking_ax(ax, df):
+def _plot_design_ranking_ax(ax, df, scores=None, order=None):
     """Internal: Plot design ranking on given axis."""
-    df = df.copy()
-    df['score'] = calculate_composite_score(df)
-    df_sorted = df.sort_values('score', ascending=True).reset_index(drop=True)
-
-    n_designs = len(df_sorted)
+    if scores is None:
+        scores = calculate_composite_score(df)
+    if order is None:
+        order = sort_order(scores)
+    scores_sorted = scores.to_numpy()[order]
+    names_sorted = short_design_names(df).to_numpy()[order]
+
+    n_designs = len(scores_sorted)
     y_pos = np.arange(n_designs)
 
-    colors = [CAT_PALETTE[i % len(CAT_PALETTE)] for i in range(n_designs)][::-1]
+    colors = cycle_palette(n_designs)[::-1]
 
-    bars = ax.barh(y_pos, df_sorted['score'], color=colors, alpha=0.9, height=0.7)
+    bars = ax.barh(y_pos, scores_sorted, color=colors, alpha=0.9, height=0.7,
+                   rasterized=n_designs >= RASTERIZE_MIN_DESIGNS)
 
     ax.set_title('Design Ranking', fontsize=10, fontweight='bold', pad=8)
     ax.set_xlabel('Composite Score', fontsize=9)
-    ax.set_yticks(y_pos)
 
-    labels = []
-    for i, (_, row) in enumerate(df_sorted.iterrows()):
-        rank = n_designs - i
-        name = simplify_design_name(row['design_name'])
-        labels.append(f"#{rank}: {name}")
-    ax.set_yticklabels(labels, fontsize=8)
+    labels = [f"#{n_designs - i}: {name}" for i, name in enumerate(names_sorted)]
+    set_category_ticks(ax.yaxis, y_pos, labels, fontsize=8)
 
     ax.set_xlim(0, 1)
     ax.xaxis.grid(True, linestyle='--', alpha=0.4)
 
 
-def _plot_metrics_table_ax(ax, df):
+def _plot_metrics_table_ax(ax, df, scores=None, order=None):
     """Internal: Plot metrics table on given axis."""
     ax.axis('off')
     ax.set_title('Design Metrics Summary', fontsize=10, fontweight='bold', pad=8)
@@ -1033,42 +1339,29 @@ def _plot_metrics_table_ax(ax, df):
             metric_cols.append(col)
     display_cols.extend(metric_cols)
 
-    df = df.copy()
-    df['score'] = calculate_composite_score(df)
+    if scores is None:
+        scores = calculate_composite_score(df)
     metric_cols.append('score')
     display_cols.append('score')
 
-    df_sorted = df.sort_values('score', ascending=False).head(6).reset_index(drop=True)
+    top = (sort_order(scores, ascending=False) if order is None else np.asarray(order))[:6]
+    df_sorted = df.iloc[top].assign(score=scores.to_numpy()[top]).reset_index(drop=True)
 
-    n_rows = len(df_sorted) + 1
     n_cols = len(display_cols)
 
-    table = ax.table(cellText=[['']*n_cols for _ in range(n_rows)],
+    cell_text = format_table_cells(df_sorted, display_cols, {'score': '%.2f'}, default='%.1f')
+    header_labels = ['Design', 'pLDDT', 'pAE', 'i_pAE', 'i_pTM', 'Score'][:n_cols]
+    table = ax.table(cellText=cell_text, colLabels=header_labels,
                      loc='center', cellLoc='center', bbox=[0.0, 0.05, 1.0, 0.9])
+    table.auto_set_font_size(False)
+    table.set_fontsize(7)
 
-    header_labels = ['Design', 'pLDDT', 'pAE', 'i_pAE', 'i_pTM', 'Score'][:n_cols]
-    for j, label in enumerate(header_labels):
+    for j in range(n_cols):
         cell = table[(0, j)]
-        cell.set_text_props(text=label, fontweight='bold', fontsize=7)
+        cell.get_text().set_fontweight('bold')
         cell.set_facecolor('#E8E8E8')
+    table[(1, n_cols - 1)].set_facecolor('#D4EDDA')
 
-    for i, (_, row) in enumerate(df_sorted.iterrows()):
-        for j, col in enumerate(display_cols):
-            cell = table[(i+1, j)]
-            val = row[col]
-            if col == 'design_name':
-                text = simplify_design_name(val)
-            elif col == 'score':
-                text = f'{val:.2f}'
-            elif col in ['plddt', 'i_plddt']:
-                text = f'{val:.1f}'
-            else:
-                text = f'{val:.1f}'
-            cell.set_text_props(text=text, fontsize=7)
-            if i == 0 and col == 'score':
-                cell.set_facecolor('#D4EDDA')
-
-    table.auto_set_font_size(False)
     for key, cell in table.get_celld().items():
         cell.set_edgecolor('#CCCCCC')
         cell.set_height(0.12)
@@ -1078,48 +1371,41 @@ def _plot_execution_timeline_ax(ax, timeline_path, results_dir):
     """Internal: Plot execution timeline on given axis."""
     ax.set_title('Execution Timeline', fontsize=10, fontweight='bold', pad=8)
 
-    default_steps = [
-        {'name': 'Config', 'start': 0, 'duration': 1},
-        {'name': 'RFdiffusion', 'start': 1, 'duration': 30},
-        {'name': 'ProteinMPNN', 'start': 31, 'duration': 5},
-        {'name': 'AlphaFold2', 'start': 36, 'duration': 20},
-        {'name': 'Analysis', 'start': 56, 'duration': 2},
-        {'name': 'Plot', 'start': 58, 'duration': 1},
-    ]
-
     steps = None
     if timeline_path is not None and timeline_path.exists():
-        with open(timeline_path) as f:
-            loaded_data = json.load(f)
+        loaded_data = read_json(timeline_path)
         steps = [s for s in loaded_data if s.get('status') == 'completed' and 'duration' in s]
         if not steps:
             steps = None
 
     if steps is None and results_dir is not None:
-        inferred_steps = infer_timeline_from_files(results_dir)
+        inferred_steps = cached_timeline_from_files(results_dir)
         if inferred_steps:
-            total_inferred = max(s['start'] + s['duration'] for s in inferred_steps)
+            total_inferred = float(np.add(*step_spans(inferred_steps)).max())
             if total_inferred <= 1440:
                 steps = inferred_steps
 
     if steps is None:
-        steps = default_steps
+        names, starts, durations = DEFAULT_STEP_NAMES, DEFAULT_STEP_STARTS, DEFAULT_STEP_DURATIONS
+    else:
+        names = [step['name'] for step in steps]
+        starts, durations = step_spans(steps)
 
-    total_time = max(s['start'] + s['duration'] for s in steps)
-    colors = [CAT_PALETTE[i % len(CAT_PALETTE)] for i in range(len(steps))]
-    y_positions = list(range(len(steps)-1, -1, -1))
+    n_steps = len(names)
+    total_time = float((starts + durations).max())
+    colors = cycle_palette(n_steps)
+    y_positions = list(range(n_steps-1, -1, -1))
 
-    for i, (step, y_pos) in enumerate(zip(steps, y_positions)):
-        ax.barh(y_pos, step['duration'], left=step['start'], height=0.6,
-                color=colors[i], edgecolor='white', linewidth=0.5)
-        ax.text(-0.5, y_pos, f"{step['name']}", ha='right', va='center', fontsize=7)
+    ax.add_collection(_timeline_bars(starts, durations, y_positions, colors))
+    for name, y_pos in zip(names, y_positions):
+        ax.text(-0.5, y_pos, f"{name}", ha='right', va='center', fontsize=7)
 
     ax.barh(-1, total_time, left=0, height=0.6, color=GRAY, alpha=0.8)
     ax.text(-0.5, -1, f"Total: ~{int(total_time)}m", ha='right', va='center', fontsize=7, fontweight='bold')
 
     ax.set_xlabel('Time (minutes)', fontsize=9)
     ax.set_xlim(-1, total_time * 1.1)
-    ax.set_ylim(-2, len(steps))
+    ax.set_ylim(-2, n_steps)
     ax.set_yticks([])
     ax.xaxis.grid(True, linestyle='--', alpha=0.4)
     ax.spines['left'].set_visible(False)
@@ -1132,18 +1418,23 @@ def main():
                         help='Output prefix (default: results_dir/binder_design)')
     parser.add_argument('--merged', '-m', action='store_true',
                         help='Create merged figure instead of separate figures')
+    parser.add_argument('--pdf', action='store_true',
+                        help='Also write vector PDFs (slower; PNG only by default)')
+    parser.add_argument('--sequential', action='store_true',
+                        help='Render all figures in this process instead of a process pool')
 
     args = parser.parse_args()
 
     if args.merged:
-        output_file = create_merged_figure(args.results_dir, args.output)
+        output_file = create_merged_figure(args.results_dir, args.output, include_vector=args.pdf)
         if output_file:
             print(f"\nVisualization complete: {output_file}")
         else:
             print("\nVisualization failed")
             exit(1)
     else:
-        output_files = create_separate_figures(args.results_dir, args.output)
+        output_files = create_separate_figures(args.results_dir, args.output, include_vector=args.pdf,
+                                               parallel=not args.sequential)
         if output_files:
             print(f"\nVisualization complete!")
         else:
@@ -1151,6 +1442,28 @@ def main():
             exit(1)
 
 
+def has_display() -> bool:
+    """Whether GUI windows can be opened (macOS, Windows or an X11/Wayland session)."""
+    return (sys.platform in ('darwin', 'win32')
+            or bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')))
+
+
+@functools.lru_cache(maxsize=1)
+def _in_notebook() -> bool:
+    """Whether this process runs in a Jupyter kernel; probed once per session."""
+    try:
+        from IPython import get_ipython
+        ipython = get_ipython()
+        return ipython is not None and 'IPKernelApp' in ipython.config
+    except (ImportError, AttributeError):
+        return False
+
+
+# Preview grid (figure, flattened axes) reused by display_results, so repeated
+# calls redraw into the same canvas instead of allocating a new one each time
+_DISPLAY_FIG = None, None
+
+
 def display_results(results_dir: str, show_all: bool = True, block: bool = True):
     """
     Display binder design results in an interactive environment.
@@ -1166,19 +1479,13 @@ def display_results(results_dir: str, show_all: bool = True, block: bool = True)
     Returns:
         dict: Dictionary with figure paths for further reference
     """
+    global _DISPLAY_FIG
     from pathlib import Path
 
     results_dir = Path(results_dir)
 
     # Check if we're in an interactive notebook environment
-    in_notebook = False
-    try:
-        from IPython import get_ipython
-        ipython = get_ipython()
-        if ipython is not None and 'IPKernelApp' in ipython.config:
-            in_notebook = True
-    except (ImportError, AttributeError):
-        pass
+    in_notebook = _in_notebook()
 
     figures = {}
     figure_files = [
@@ -1204,29 +1511,42 @@ def display_results(results_dir: str, show_all: bool = True, block: bool = True)
             else:
                 print(f"Warning: {png_path} not found")
     else:
-        import matplotlib
-        try:
-            matplotlib.use('TkAgg')
-        except:
+        # Stay on the module's Agg backend when no window can be opened, so
+        # headless sessions never import a GUI toolkit
+        if has_display():
             try:
-                matplotlib.use('Qt5Agg')
+                matplotlib.use('TkAgg')
             except:
-                pass
-
-        import matplotlib.pyplot as plt
-        from PIL import Image
+                try:
+                    matplotlib.use('Qt5Agg')
+                except:
+                    pass
 
         plt.ion()
 
         n_figs = len(figure_files)
-        fig, axes = plt.subplots(2, 3, figsize=(14, 9))
-        axes = axes.flatten()
+        # Recreate the grid only if it was never built or its window was closed
+        if _DISPLAY_FIG[0] is None or not plt.fignum_exists(_DISPLAY_FIG[0].number):
+            # Every panel is a bare image, so constrained layout places the grid
+            # in one pass without measuring tick labels
+            fig, axes = plt.subplots(2, 3, figsize=(14, 9), sharex=False, sharey=False,
+                                     constrained_layout=True,
+                                     gridspec_kw={'wspace': 0.02, 'hspace': 0.02})
+            _DISPLAY_FIG = fig, axes.flatten()
+        fig, axes = _DISPLAY_FIG
+        for ax in axes:
+            ax.clear()
+            ax.axis('off')
+        panel_width, panel_height = fig.get_size_inches() * fig.dpi / (3, 2)
 
         for i, (fig_name, title) in enumerate(figure_files):
             png_path = results_dir / f"binder_design_{fig_name}.png"
             if png_path.exists():
+                # Downsample to the on-screen panel size while decoding, then
+                # hand imshow uint8 pixels it can show without resampling
                 img = Image.open(png_path)
-                axes[i].imshow(img)
+                img.thumbnail((int(panel_width), int(panel_height)), Image.LANCZOS)
+                axes[i].imshow(np.asarray(img), interpolation='none')
                 axes[i].axis('off')
                 figures[fig_name] = str(png_path)
             else:
@@ -1234,9 +1554,9 @@ def display_results(results_dir: str, show_all: bool = True, block: bool = True)
                             ha='center', va='center', transform=axes[i].transAxes)
                 axes[i].axis('off')
 
-        plt.tight_layout()
         figures['combined_figure'] = fig
-        plt.show(block=block)
+        if matplotlib.get_backend().lower() != 'agg':
+            plt.show(block=block)
 
     # Print summary
     csv_path = results_dir / "design_metrics.csv"
@@ -1244,17 +1564,17 @@ def display_results(results_dir: str, show_all: bool = True, block: bool = True)
         csv_path = results_dir / "metrics.csv"
 
     if csv_path.exists():
-        df = pd.read_csv(csv_path)
-        df['score'] = calculate_composite_score(df)
-        df_sorted = df.sort_values('score', ascending=False)
+        df = read_metrics_csv(csv_path)
+        scores = calculate_composite_score(df)
+        top_idx = sort_order(scores, ascending=False)[:3]
 
         print("\n" + "="*60)
         print("BINDER DESIGN SUMMARY")
         print("="*60)
         print(f"Total designs: {len(df)}")
         print(f"\nTop 3 designs by composite score:")
-        for i, (_, row) in enumerate(df_sorted.head(3).iterrows()):
-            name = simplify_design_name(row['design_name'])
+        top = df.iloc[top_idx].assign(score=scores.to_numpy()[top_idx])
+        for i, (name, row) in enumerate(zip(short_design_names(top), top.to_dict('records'))):
             plddt = row.get('plddt', 'N/A')
             pae = row.get('i_pae', row.get('pae', 'N/A'))
             print(f"  {i+1}. {name}: pLDDT={plddt:.1f}, pAE={pae:.1f}, score={row['score']:.2f}")
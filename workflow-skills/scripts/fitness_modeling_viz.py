@@ -12,8 +12,11 @@ Each figure is saved as a separate 4x4 inch file.
 """
 
 import argparse
+import functools
 import json
 import os
+import re
+from dataclasses import dataclass
 from pathlib import Path
 
 import matplotlib
@@ -25,16 +28,47 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 import seaborn as sns
+from PIL import Image
 
 # Color palettes from plot_style_utils
 CAT_PALETTE = sns.color_palette('colorblind')
-DIV_PALETTE = sns.color_palette("BrBG_r", 100)
-SEQ_PALETTE = sns.cubehelix_palette(100, start=0.5, rot=-0.75)
 GRAY = [0.5, 0.5, 0.5]
+DENSITY_CMAP = sns.cubehelix_palette(start=0.5, rot=-0.75, as_cmap=True)
+
+# Backbone names -> x-tick labels, with line breaks for the long ones
+LABEL_MAP = {
+    'EV+OneHot': 'EV+OneHot',
+    'ESM2-650M': 'ESM2\n650M',
+    'ESM2-3B': 'ESM2\n3B',
+    'ProtT5-XL': 'ProtT5-XL',
+}
+
+# Non-pLM backbones, left out of the head model comparison
+EV_BACKBONES = frozenset({'EV+OneHot', 'EV', 'OneHot'})
 
 # Figure size for individual plots
 FIGSIZE = (4, 4)
 
+# Predicted-vs-observed panels switch from a scatter to a hexbin density plot
+# above this many samples; past it the markers overplot into a solid block
+HEXBIN_MIN_SAMPLES = 5000
+
+# zlib level for PNG output; level 1 writes several times faster than the
+# default level 6 for slightly larger files
+PNG_COMPRESS_LEVEL = 1
+
+# Columns of a model comparison table
+MODEL_COLUMNS = ['backbone', 'head', 'mean_cv_spearman', 'std_cv_spearman']
+
+# Compact dtypes for those columns: names repeat across models, and scores
+# only need float32 precision
+MODEL_DTYPES = {'backbone': 'category', 'head': 'category',
+                'mean_cv_spearman': 'float32', 'std_cv_spearman': 'float32'}
+
+# CV score columns read from per-model training_summary.csv files (current
+# and legacy names); every other column is skipped while parsing
+SUMMARY_COLUMNS = frozenset(['mean_cv_spearman', 'std_cv_spearman', 'cv_mean', 'cv_std'])
+
 
 def prettify_ax(ax):
     """Make axes more pleasant to look at"""
@@ -48,29 +82,49 @@ def prettify_ax(ax):
 
 def simple_ax(figsize=FIGSIZE, **kwargs):
     """Shortcut to make and 'prettify' a simple figure with 1 axis"""
-    fig = plt.figure(figsize=figsize)
+    fig = plt.figure(figsize=figsize, constrained_layout=True)
     ax = fig.add_subplot(111, **kwargs)
     prettify_ax(ax)
     return fig, ax
 
 
+# Context last applied by set_pub_plot_context, so repeated calls are free
+_PLOT_CONTEXT = None
+
+
 def set_pub_plot_context(context="talk"):
     """Set publication-quality plot context"""
+    global _PLOT_CONTEXT
+    if context == _PLOT_CONTEXT:
+        return
     sns.set(style="white", context=context)
+    _PLOT_CONTEXT = context
+
+
+def write_png(fig, path, dpi, transparent=False):
+    """Draw the figure once with Agg and write the PNG from the canvas buffer."""
+    if transparent:
+        for patch in [fig.patch] + [ax.patch for ax in fig.axes]:
+            patch.set_facecolor('none')
+            patch.set_edgecolor('none')
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).save(
+        path, optimize=False, compress_level=PNG_COMPRESS_LEVEL, dpi=(dpi, dpi))
 
 
 def save_for_pub(fig, path, dpi=300, include_raster=True):
     """Save figure in publication-ready formats"""
-    fig.savefig(path + ".pdf", dpi=dpi, bbox_inches='tight', transparent=True)
+    fig.savefig(path + ".pdf", dpi=dpi, transparent=True)
     if include_raster:
-        fig.savefig(path + ".png", dpi=dpi, bbox_inches='tight', transparent=True)
+        write_png(fig, path + ".png", dpi, transparent=True)
 
 
 def load_all_models(results_dir: Path) -> pd.DataFrame:
     """Load all model results from results directory."""
     csv_path = results_dir / "all_models_comparison.csv"
     if csv_path.exists():
-        return pd.read_csv(csv_path)
+        return pd.read_csv(csv_path, dtype=MODEL_DTYPES)
 
     # If not found, try to construct from individual files
     results = []
@@ -81,47 +135,41 @@ def load_all_models(results_dir: Path) -> pd.DataFrame:
         ev_df = pd.read_csv(ev_metrics_path)
         cv_mean = ev_df[ev_df['fold'] == 'mean']['spearman_correlation'].values[0]
         cv_std = ev_df[ev_df['fold'] == 'std']['spearman_correlation'].values[0]
-        results.append({
-            'backbone': 'EV+OneHot',
-            'head': 'ridge',
-            'mean_cv_spearman': cv_mean,
-            'std_cv_spearman': cv_std
-        })
-
-    # Look for training_summary.csv files in subdirectories
-    for subdir in results_dir.iterdir():
-        if subdir.is_dir():
-            summary_path = subdir / "training_summary.csv"
-            if summary_path.exists():
-                df = pd.read_csv(summary_path)
-                if 'mean_cv_spearman' in df.columns:
-                    mean_sp = df['mean_cv_spearman'].values[0]
-                    std_sp = df['std_cv_spearman'].values[0]
-                elif 'cv_mean' in df.columns:
-                    mean_sp = df['cv_mean'].values[0]
-                    std_sp = df['cv_std'].values[0]
-                else:
-                    continue
+        results.append(('EV+OneHot', 'ridge', cv_mean, cv_std))
+
+    # Look for training_summary.csv files in subdirectories, in one listing pass
+    with os.scandir(results_dir) as it:
+        subdirs = [entry for entry in it if entry.is_dir()]
+
+    for entry in subdirs:
+        # Only the first row of the CV score columns is needed
+        try:
+            df = pd.read_csv(os.path.join(entry.path, "training_summary.csv"), engine='c',
+                             usecols=lambda col: col in SUMMARY_COLUMNS, dtype=np.float64, nrows=1)
+        except FileNotFoundError:
+            continue
+        if 'mean_cv_spearman' in df.columns:
+            mean_sp = df['mean_cv_spearman'].values[0]
+            std_sp = df['std_cv_spearman'].values[0]
+        elif 'cv_mean' in df.columns:
+            mean_sp = df['cv_mean'].values[0]
+            std_sp = df['cv_std'].values[0]
+        else:
+            continue
 
-                # Parse backbone and head from directory name
-                dir_name = subdir.name
-                # Try to parse formats like "ESM2-650M_svr" or "ProtT5-XL_knn"
-                parts = dir_name.rsplit('_', 1)
-                if len(parts) == 2:
-                    backbone, head = parts
-                    results.append({
-                        'backbone': backbone,
-                        'head': head,
-                        'mean_cv_spearman': mean_sp,
-                        'std_cv_spearman': std_sp
-                    })
+        # Parse backbone and head from directory name
+        # Try to parse formats like "ESM2-650M_svr" or "ProtT5-XL_knn"
+        parts = entry.name.rsplit('_', 1)
+        if len(parts) == 2:
+            backbone, head = parts
+            results.append((backbone, head, mean_sp, std_sp))
 
-    return pd.DataFrame(results)
+    return pd.DataFrame.from_records(results, columns=MODEL_COLUMNS).astype(MODEL_DTYPES)
 
 
 def get_best_per_backbone(df: pd.DataFrame) -> pd.DataFrame:
     """Get best head model for each backbone."""
-    return df.loc[df.groupby('backbone')['mean_cv_spearman'].idxmax()].reset_index(drop=True)
+    return df.loc[df.groupby('backbone', observed=True)['mean_cv_spearman'].idxmax()].reset_index(drop=True)
 
 
 def plot_backbone_comparison(best_df: pd.DataFrame, output_path: str = None):
@@ -141,8 +189,8 @@ def plot_backbone_comparison(best_df: pd.DataFrame, output_path: str = None):
     best_df = best_df.sort_values('mean_cv_spearman', ascending=False)
 
     methods = best_df['backbone'].tolist()
-    spearman = best_df['mean_cv_spearman'].tolist()
-    spearman_std = best_df['std_cv_spearman'].tolist()
+    spearman = best_df['mean_cv_spearman'].to_numpy()
+    spearman_std = best_df['std_cv_spearman'].to_numpy()
 
     # Use colorblind palette for different backbones
     colors = [CAT_PALETTE[i % len(CAT_PALETTE)] for i in range(len(methods))]
@@ -157,27 +205,14 @@ def plot_backbone_comparison(best_df: pd.DataFrame, output_path: str = None):
     ax.set_xticks(x_pos)
 
     # Set y-limit to accommodate error bars (max value + max std + padding)
-    max_with_error = max(s + e for s, e in zip(spearman, spearman_std))
+    max_with_error = float(np.add(spearman, spearman_std).max())
     ax.set_ylim([0, max_with_error * 1.15])
     ax.yaxis.grid(True, linestyle='--', alpha=0.4)
 
     # Format x-tick labels with line breaks
-    labels = []
-    for m in methods:
-        if m == 'EV+OneHot':
-            labels.append('EV+OneHot')
-        elif m == 'ESM2-650M':
-            labels.append('ESM2\n650M')
-        elif m == 'ESM2-3B':
-            labels.append('ESM2\n3B')
-        elif m == 'ProtT5-XL':
-            labels.append('ProtT5-XL')
-        else:
-            labels.append(m)
+    labels = [LABEL_MAP.get(m, m) for m in methods]
     ax.set_xticklabels(labels, fontsize=9, rotation=45, ha='right')
 
-    plt.tight_layout()
-
     if output_path:
         save_for_pub(fig, output_path)
         print(f"Saved: {output_path}.png, {output_path}.pdf")
@@ -185,6 +220,26 @@ def plot_backbone_comparison(best_df: pd.DataFrame, output_path: str = None):
     return fig
 
 
+@functools.lru_cache(maxsize=8)
+def _load_prediction_pair(pred_path: str, obs_path: str, pred_mtime_ns: int, obs_mtime_ns: int) -> tuple:
+    """Predicted and observed arrays plus their Spearman rho, cached per file version."""
+    # Memory-map the saved arrays and keep a single float32 copy of each
+    predicted = np.load(pred_path, mmap_mode='r').astype(np.float32, copy=False)
+    observed = np.load(obs_path, mmap_mode='r').astype(np.float32, copy=False)
+    # Cached arrays are shared between callers
+    predicted.flags.writeable = False
+    observed.flags.writeable = False
+    # Spearman rho as the Pearson correlation of ranks; the p-value is not needed
+    rho = np.corrcoef(stats.rankdata(predicted), stats.rankdata(observed))[0, 1]
+    return predicted, observed, rho
+
+
+def load_prediction_pair(pred_path: Path, obs_path: Path) -> tuple:
+    """(predicted, observed, rho) for saved .npy files, reloaded only after they change."""
+    return _load_prediction_pair(str(pred_path), str(obs_path),
+                                 os.stat(pred_path).st_mtime_ns, os.stat(obs_path).st_mtime_ns)
+
+
 def load_model_predictions(results_dir: Path, best_model_info: dict, data_df: pd.DataFrame):
     """
     Load predictions from trained models.
@@ -195,14 +250,14 @@ def load_model_predictions(results_dir: Path, best_model_info: dict, data_df: pd
     """
     predicted = None
     observed = None
+    actual_rho = None
     model_name = None
 
     # ALWAYS try EV+OneHot first (most robust model)
     ev_pred_path = results_dir / "ev_onehot_predictions.npy"
     ev_obs_path = results_dir / "ev_onehot_observed.npy"
     if ev_pred_path.exists() and ev_obs_path.exists():
-        predicted = np.load(ev_pred_path)
-        observed = np.load(ev_obs_path)
+        predicted, observed, actual_rho = load_prediction_pair(ev_pred_path, ev_obs_path)
         model_name = "EV+OneHot (Ridge)"
         print(f"Loaded EV+OneHot predictions (most robust model)")
 
@@ -232,8 +287,8 @@ def load_model_predictions(results_dir: Path, best_model_info: dict, data_df: pd
                 matching_dir = results_dir / dir_name
                 if matching_dir in available_models:
                     final_model = matching_dir / "final_model"
-                    observed = np.load(final_model / "ys_train.npy")
-                    predicted = np.load(final_model / "ys_train_pred.npy")
+                    predicted, observed, actual_rho = load_prediction_pair(
+                        final_model / "ys_train_pred.npy", final_model / "ys_train.npy")
                     model_name = f"{row['backbone']} ({row['head'].upper()})"
                     print(f"Loaded predictions from {final_model} (best available pLM: {model_name})")
                     break
@@ -241,8 +296,8 @@ def load_model_predictions(results_dir: Path, best_model_info: dict, data_df: pd
             # Fallback: just use the first available
             subdir = available_models[0]
             final_model = subdir / "final_model"
-            observed = np.load(final_model / "ys_train.npy")
-            predicted = np.load(final_model / "ys_train_pred.npy")
+            predicted, observed, actual_rho = load_prediction_pair(
+                final_model / "ys_train_pred.npy", final_model / "ys_train.npy")
             parts = subdir.name.rsplit('_', 1)
             if len(parts) == 2:
                 model_name = f"{parts[0]} ({parts[1].upper()})"
@@ -251,14 +306,29 @@ def load_model_predictions(results_dir: Path, best_model_info: dict, data_df: pd
             print(f"Loaded predictions from {final_model} (fallback: {model_name})")
 
     if predicted is not None and observed is not None:
-        actual_rho, _ = stats.spearmanr(predicted, observed)
         return predicted, observed, actual_rho, model_name
 
     return None
 
 
+def linear_fit(x: np.ndarray, y: np.ndarray) -> tuple:
+    """Least-squares slope and intercept of y on x, in closed form."""
+    x_mean, y_mean = x.mean(), y.mean()
+    dx = x - x_mean
+    slope = (dx * (y - y_mean)).sum() / (dx * dx).sum()
+    return slope, y_mean - slope * x_mean
+
+
+def plot_prediction_points(ax, predicted: np.ndarray, observed: np.ndarray):
+    """Scatter predicted vs observed values, or bin them into hexagons for large n."""
+    if len(observed) > HEXBIN_MIN_SAMPLES:
+        ax.hexbin(predicted, observed, gridsize=60, mincnt=1, cmap=DENSITY_CMAP)
+    else:
+        ax.scatter(predicted, observed, c=CAT_PALETTE[0], alpha=0.5, s=15, edgecolors='none')
+
+
 def plot_predicted_vs_observed(results_dir: Path, best_model_info: dict, data_df: pd.DataFrame,
-                               output_path: str = None):
+                               output_path: str = None, model_data: tuple = None):
     """
     Plot 2: Scatter plot of predicted vs observed for best model.
 
@@ -267,6 +337,7 @@ def plot_predicted_vs_observed(results_dir: Path, best_model_info: dict, data_df
         best_model_info: Dict with best model information
         data_df: DataFrame with fitness data
         output_path: Path prefix for saving (without extension)
+        model_data: Result of load_model_predictions(), if already loaded
 
     Returns:
         fig: matplotlib figure object
@@ -274,7 +345,8 @@ def plot_predicted_vs_observed(results_dir: Path, best_model_info: dict, data_df
     fig, ax = simple_ax(figsize=FIGSIZE)
 
     # Try to load actual predictions from trained model
-    model_data = load_model_predictions(results_dir, best_model_info, data_df)
+    if model_data is None:
+        model_data = load_model_predictions(results_dir, best_model_info, data_df)
 
     if model_data is not None:
         predicted, observed, actual_rho, model_name = model_data
@@ -288,8 +360,10 @@ def plot_predicted_vs_observed(results_dir: Path, best_model_info: dict, data_df
 
         np.random.seed(42)
         noise = np.random.randn(n_samples)
-        predicted = rho * stats.zscore(observed) + np.sqrt(1 - rho**2) * noise
-        predicted = predicted * np.std(observed) + np.mean(observed)
+        # z-score observed once and scale the mix straight back to its units
+        obs_mean, obs_std = observed.mean(), observed.std()
+        z = (observed - obs_mean) / obs_std
+        predicted = (rho * z + np.sqrt(1 - rho * rho) * noise) * obs_std + obs_mean
         actual_rho = rho
 
         # Construct model name from best_model_info
@@ -299,13 +373,12 @@ def plot_predicted_vs_observed(results_dir: Path, best_model_info: dict, data_df
             model_name = "EV+OneHot (Ridge)"
 
     # Scatter plot using colorblind palette
-    ax.scatter(predicted, observed, c=CAT_PALETTE[0], alpha=0.5, s=15, edgecolors='none')
+    plot_prediction_points(ax, predicted, observed)
 
-    # Add correlation line
-    z = np.polyfit(predicted, observed, 1)
-    p = np.poly1d(z)
-    x_line = np.linspace(predicted.min(), predicted.max(), 100)
-    ax.plot(x_line, p(x_line), 'k--', alpha=0.5, linewidth=1)
+    # Add correlation line; its two end points are all that is needed
+    slope, intercept = linear_fit(predicted, observed)
+    x_line = np.array([predicted.min(), predicted.max()])
+    ax.plot(x_line, slope * x_line + intercept, 'k--', alpha=0.5, linewidth=1)
 
     ax.set_title('Predicted vs Observed', fontsize=12, fontweight='bold', pad=10)
     ax.set_xlabel('Predicted', fontsize=10)
@@ -315,8 +388,6 @@ def plot_predicted_vs_observed(results_dir: Path, best_model_info: dict, data_df
             transform=ax.transAxes, fontsize=9, verticalalignment='top',
             bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
 
-    plt.tight_layout()
-
     if output_path:
         save_for_pub(fig, output_path)
         print(f"Saved: {output_path}.png, {output_path}.pdf")
@@ -335,33 +406,35 @@ def plot_head_model_table(all_df: pd.DataFrame, output_path: str = None):
     Returns:
         fig: matplotlib figure object
     """
-    fig = plt.figure(figsize=FIGSIZE)
+    fig = plt.figure(figsize=FIGSIZE, constrained_layout=True)
     ax = fig.add_subplot(111)
     ax.axis('off')
     ax.set_title('Head Model Comparison', fontsize=12, fontweight='bold', pad=10)
 
     # Filter to pLM backbones only (exclude EV+OneHot)
-    plm_df = all_df[~all_df['backbone'].str.contains('EV|OneHot', case=False, na=False)].copy()
+    plm_df = all_df[~all_df['backbone'].isin(EV_BACKBONES)].copy()
 
     if plm_df.empty:
         ax.text(0.5, 0.5, 'No pLM results available', ha='center', va='center',
                 transform=ax.transAxes, fontsize=10)
-        plt.tight_layout()
         if output_path:
             save_for_pub(fig, output_path)
             print(f"Saved: {output_path}.png, {output_path}.pdf")
         return fig
 
-    # Pivot to get table format
-    pivot_df = plm_df.pivot(index='backbone', columns='head', values='mean_cv_spearman')
+    # Pivot to get table format; categorical backbones keep their row order
+    # from the data, so sort them by name
+    pivot_df = plm_df.pivot(index='backbone', columns='head', values='mean_cv_spearman').sort_index()
 
     # Reorder columns if they exist
     head_order = ['svr', 'xgboost', 'knn']
     cols = [c for c in head_order if c in pivot_df.columns]
     pivot_df = pivot_df[cols]
 
-    # Find best per row
-    best_per_row = pivot_df.idxmax(axis=1)
+    # Find best per row and overall from one array
+    scores = pivot_df.to_numpy()
+    best_col_idx = np.nanargmax(scores, axis=1)
+    best_row_i, best_col_i = np.unravel_index(np.nanargmax(scores), scores.shape)
 
     # Create table
     n_rows = len(pivot_df) + 1  # +1 for header
@@ -387,21 +460,18 @@ def plot_head_model_table(all_df: pd.DataFrame, output_path: str = None):
         cell = table[(i+1, 0)]
         cell.set_text_props(text=backbone, fontsize=9)
 
-        best_head = best_per_row[backbone]
-
         for j, col in enumerate(cols):
             cell = table[(i+1, j+1)]
             val = row[col]
             cell.set_text_props(text=f'{val:.2f}', fontsize=9)
 
             # Highlight best in row
-            if col == best_head:
+            if j == best_col_idx[i]:
                 cell.set_facecolor('#FFF3CD')  # Light yellow
 
-    # Find overall best
-    best_backbone = pivot_df.max(axis=1).idxmax()
-    best_head_overall = best_per_row[best_backbone]
-    best_val = pivot_df.loc[best_backbone, best_head_overall]
+    # Overall best
+    best_backbone = pivot_df.index[best_row_i]
+    best_head_overall = cols[best_col_i]
 
     # Add "Best:" annotation
     ax.text(0.5, 0.02, f'Best: {best_backbone} + {best_head_overall.upper()}',
@@ -412,8 +482,6 @@ def plot_head_model_table(all_df: pd.DataFrame, output_path: str = None):
         cell.set_edgecolor('#CCCCCC')
         cell.set_height(0.15)
 
-    plt.tight_layout()
-
     if output_path:
         save_for_pub(fig, output_path)
         print(f"Saved: {output_path}.png, {output_path}.pdf")
@@ -421,49 +489,78 @@ def plot_head_model_table(all_df: pd.DataFrame, output_path: str = None):
     return fig
 
 
+# Files written by each workflow step, as glob patterns relative to the results dir
+STEP_FILES = {
+    'MSA': ['*.a3m'],
+    'PLMC': ['plmc/*.model_params', 'plmc/*.EC'],
+    'EV+OneHot': ['ridge_model.joblib', 'metrics_summary.csv', 'ev_onehot_predictions.npy'],
+    'ESM': ['esm2_*/final_model/*.joblib', 'esm2_*/training_summary.csv'],
+    'ProtTrans': ['ProtT5-XL_*/final_model/*.joblib', 'ProtAlbert_*/final_model/*.joblib',
+                  'ProtT5-XL_*/training_summary.csv', 'ProtAlbert_*/training_summary.csv'],
+    'Plot': ['fitness_modeling_summary.png', 'all_models_comparison.csv']
+}
+
+
+def _glob_regex(pattern: str) -> str:
+    """Translate a glob pattern over '/'-separated relative paths to a regex.
+
+    As with glob.glob, '*' and '?' stay within one path segment.
+    """
+    return '/'.join(re.escape(segment).replace(r'\*', '[^/]*').replace(r'\?', '[^/]')
+                    for segment in pattern.split('/'))
+
+
+# One compiled regex per step, matching any of its patterns
+STEP_REGEXES = {step: re.compile('(?:' + '|'.join(_glob_regex(p) for p in patterns) + r')\Z')
+                for step, patterns in STEP_FILES.items()}
+
+
+def _walk_mtimes(root, prefix=''):
+    """Yield (relative path, mtime) for every file and directory under root.
+
+    One os.scandir pass with a single stat per entry. Hidden entries are
+    skipped, as glob wildcards skip them.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            rel = prefix + entry.name
+            try:
+                yield rel, entry.stat().st_mtime
+            except OSError:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_mtimes(entry.path, rel + '/')
+
+
 def infer_timeline_from_files(results_dir: Path) -> list:
     """
     Infer execution timeline from file modification timestamps.
     Returns list of steps with start times and durations in minutes.
     """
-    import os
-
-    # Define files to check for each step
-    step_files = {
-        'MSA': ['*.a3m'],
-        'PLMC': ['plmc/*.model_params', 'plmc/*.EC'],
-        'EV+OneHot': ['ridge_model.joblib', 'metrics_summary.csv', 'ev_onehot_predictions.npy'],
-        'ESM': ['esm2_*/final_model/*.joblib', 'esm2_*/training_summary.csv'],
-        'ProtTrans': ['ProtT5-XL_*/final_model/*.joblib', 'ProtAlbert_*/final_model/*.joblib',
-                      'ProtT5-XL_*/training_summary.csv', 'ProtAlbert_*/training_summary.csv'],
-        'Plot': ['fitness_modeling_summary.png', 'all_models_comparison.csv']
-    }
-
+    # Walk the results tree once, keeping the earliest and latest mtime per step
     step_times = {}
-
-    for step_name, patterns in step_files.items():
-        times = []
-        for pattern in patterns:
-            import glob
-            matches = glob.glob(str(results_dir / pattern))
-            for match in matches:
-                try:
-                    mtime = os.path.getmtime(match)
-                    times.append(mtime)
-                except:
-                    pass
-        if times:
-            step_times[step_name] = {
-                'start': min(times),
-                'end': max(times)
-            }
+    for rel, mtime in _walk_mtimes(results_dir):
+        for step_name, regex in STEP_REGEXES.items():
+            if regex.match(rel):
+                times = step_times.get(step_name)
+                if times is None:
+                    step_times[step_name] = {'start': mtime, 'end': mtime}
+                else:
+                    times['start'] = min(times['start'], mtime)
+                    times['end'] = max(times['end'], mtime)
 
     if not step_times:
         return None
 
-    # Convert to relative times in minutes
-    all_times = [t['start'] for t in step_times.values()] + [t['end'] for t in step_times.values()]
-    base_time = min(all_times)
+    # Convert to relative times in minutes; every step starts no later than
+    # it ends, so the earliest start is the earliest time overall
+    base_time = min(times['start'] for times in step_times.values())
 
     steps = []
     step_order = ['MSA', 'PLMC', 'EV+OneHot', 'ESM', 'ProtTrans', 'Plot']
@@ -582,8 +679,6 @@ def plot_execution_timeline(timeline_path: Path, results_dir: Path = None, outpu
     # Remove y-axis
     ax.spines['left'].set_visible(False)
 
-    plt.tight_layout()
-
     if output_path:
         save_for_pub(fig, output_path)
         print(f"Saved: {output_path}.png, {output_path}.pdf")
@@ -591,30 +686,24 @@ def plot_execution_timeline(timeline_path: Path, results_dir: Path = None, outpu
     return fig
 
 
-def create_separate_figures(results_dir: str, output_prefix: str = None):
-    """
-    Create four separate visualization figures.
+@dataclass
+class VizContext:
+    """Inputs shared by all fitness figures, loaded once per results directory."""
+    results_dir: Path
+    all_df: pd.DataFrame
+    best_df: pd.DataFrame
+    best_model_info: dict
+    data_df: pd.DataFrame
+    # (predicted, observed, actual_rho, model_name), or None if none were saved
+    model_data: tuple = None
 
-    Args:
-        results_dir: Path to results directory
-        output_prefix: Path prefix for saving (without extension)
 
-    Returns:
-        list: Paths to saved figures
+def load_viz_context(results_dir) -> VizContext:
+    """Load model results, fitness data and best-model predictions for results_dir.
+
+    Returns None if the directory holds no model results.
     """
     results_dir = Path(results_dir)
-
-    # Create figures subdirectory
-    figures_dir = results_dir / "figures"
-    figures_dir.mkdir(parents=True, exist_ok=True)
-
-    if output_prefix is None:
-        output_prefix = str(figures_dir / "fitness_modeling")
-
-    # Set publication-quality plot context
-    set_pub_plot_context(context="talk")
-
-    # Load data
     all_df = load_all_models(results_dir)
 
     if all_df.empty:
@@ -635,21 +724,56 @@ def create_separate_figures(results_dir: str, output_prefix: str = None):
         # Create dummy data
         data_df = pd.DataFrame({'log_fitness': np.random.randn(100)})
 
+    model_data = load_model_predictions(results_dir, best_model_info, data_df)
+    return VizContext(results_dir, all_df, best_df, best_model_info, data_df, model_data)
+
+
+def create_separate_figures(results_dir: str, output_prefix: str = None, ctx: VizContext = None):
+    """
+    Create four separate visualization figures.
+
+    Args:
+        results_dir: Path to results directory
+        output_prefix: Path prefix for saving (without extension)
+        ctx: Inputs from load_viz_context(results_dir); loaded here if omitted
+
+    Returns:
+        list: Paths to saved figures
+    """
+    results_dir = Path(results_dir)
+
+    # Create figures subdirectory
+    figures_dir = results_dir / "figures"
+    figures_dir.mkdir(parents=True, exist_ok=True)
+
+    if output_prefix is None:
+        output_prefix = str(figures_dir / "fitness_modeling")
+
+    # Set publication-quality plot context
+    set_pub_plot_context(context="talk")
+
+    # Load data, unless the caller already did
+    if ctx is None:
+        ctx = load_viz_context(results_dir)
+        if ctx is None:
+            return None
+
     saved_files = []
 
     # Figure 1: Backbone comparison
-    fig1 = plot_backbone_comparison(best_df, f"{output_prefix}_backbone_comparison")
+    fig1 = plot_backbone_comparison(ctx.best_df, f"{output_prefix}_backbone_comparison")
     saved_files.append(f"{output_prefix}_backbone_comparison.png")
     plt.close(fig1)
 
     # Figure 2: Predicted vs Observed
-    fig2 = plot_predicted_vs_observed(results_dir, best_model_info, data_df,
-                                       f"{output_prefix}_predicted_vs_observed")
+    fig2 = plot_predicted_vs_observed(results_dir, ctx.best_model_info, ctx.data_df,
+                                       f"{output_prefix}_predicted_vs_observed",
+                                       model_data=ctx.model_data)
     saved_files.append(f"{output_prefix}_predicted_vs_observed.png")
     plt.close(fig2)
 
     # Figure 3: Head model table
-    fig3 = plot_head_model_table(all_df, f"{output_prefix}_head_model_table")
+    fig3 = plot_head_model_table(ctx.all_df, f"{output_prefix}_head_model_table")
     saved_files.append(f"{output_prefix}_head_model_table.png")
     plt.close(fig3)
 
@@ -660,33 +784,15 @@ def create_separate_figures(results_dir: str, output_prefix: str = None):
     saved_files.append(f"{output_prefix}_execution_timeline.png")
     plt.close(fig4)
 
-    # Create merged 2x2 summary figure
-    from PIL import Image
-    fig_merged, axes = plt.subplots(2, 2, figsize=(8, 8))
-    axes = axes.flatten()
-
-    figure_names = [
-        f"{output_prefix}_backbone_comparison.png",
-        f"{output_prefix}_predicted_vs_observed.png",
-        f"{output_prefix}_head_model_table.png",
-        f"{output_prefix}_execution_timeline.png",
-    ]
-
-    for i, fig_path in enumerate(figure_names):
-        if Path(fig_path).exists():
-            img = Image.open(fig_path)
-            axes[i].imshow(img)
-            axes[i].axis('off')
-        else:
-            axes[i].text(0.5, 0.5, "Not found", ha='center', va='center')
-            axes[i].axis('off')
-
-    plt.tight_layout()
+    # Create merged 2x2 summary figure, drawing the panels directly rather
+    # than decoding the PNGs just written
+    fig_merged = plt.figure(figsize=(8, 8), constrained_layout=True)
+    draw_four_panels(fig_merged, ctx)
 
     # Save merged figure
     summary_path = f"{output_prefix}_summary"
-    fig_merged.savefig(summary_path + ".png", dpi=150, bbox_inches='tight')
-    fig_merged.savefig(summary_path + ".pdf", dpi=300, bbox_inches='tight')
+    write_png(fig_merged, summary_path + ".png", dpi=150)
+    fig_merged.savefig(summary_path + ".pdf", dpi=300)
     saved_files.append(summary_path + ".png")
     print(f"Saved merged figure: {summary_path}.png and {summary_path}.pdf")
     plt.close(fig_merged)
@@ -698,7 +804,7 @@ def create_separate_figures(results_dir: str, output_prefix: str = None):
     return saved_files
 
 
-def create_four_panel_figure(results_dir: str, output_prefix: str = None):
+def create_four_panel_figure(results_dir: str, output_prefix: str = None, ctx: VizContext = None):
     """
     Create combined four-panel visualization figure (legacy function).
 
@@ -707,6 +813,7 @@ def create_four_panel_figure(results_dir: str, output_prefix: str = None):
     Args:
         results_dir: Path to results directory
         output_prefix: Path prefix for saving (without extension)
+        ctx: Inputs from load_viz_context(results_dir); loaded here if omitted
 
     Returns:
         str: Path to saved combined figure
@@ -723,30 +830,26 @@ def create_four_panel_figure(results_dir: str, output_prefix: str = None):
     # Set publication-quality plot context
     set_pub_plot_context(context="talk")
 
-    # Load data
-    all_df = load_all_models(results_dir)
+    # Load data, unless the caller already did
+    if ctx is None:
+        ctx = load_viz_context(results_dir)
+        if ctx is None:
+            return None
 
-    if all_df.empty:
-        print("Error: No model results found in", results_dir)
-        return None
+    # Create figure with 2x2 grid (8x8 for combined)
+    fig = plt.figure(figsize=(8, 8), constrained_layout=True)
+    draw_four_panels(fig, ctx)
 
-    best_df = get_best_per_backbone(all_df)
+    # Save figures
+    save_for_pub(fig, output_prefix, include_raster=True)
 
-    # Find overall best model
-    best_idx = best_df['mean_cv_spearman'].idxmax()
-    best_model_info = best_df.loc[best_idx].to_dict()
+    plt.close(fig)
 
-    # Load fitness data
-    data_path = results_dir / "data.csv"
-    if data_path.exists():
-        data_df = pd.read_csv(data_path)
-    else:
-        # Create dummy data
-        data_df = pd.DataFrame({'log_fitness': np.random.randn(100)})
+    return f"{output_prefix}.png"
 
-    # Create figure with 2x2 grid (8x8 for combined)
-    fig = plt.figure(figsize=(8, 8))
 
+def draw_four_panels(fig, ctx: VizContext):
+    """Draw the four summary plots on a 2x2 grid of new axes in fig."""
     # Create subplots with specific positioning
     ax1 = fig.add_subplot(2, 2, 1)  # Top-left: Backbone comparison
     prettify_ax(ax1)
@@ -757,21 +860,13 @@ def create_four_panel_figure(results_dir: str, output_prefix: str = None):
     prettify_ax(ax4)
 
     # Generate plots (using internal versions that take ax)
-    _plot_backbone_comparison_ax(ax1, best_df)
-    _plot_predicted_vs_observed_ax(ax2, results_dir, best_model_info, data_df)
-    _plot_head_model_table_ax(ax3, all_df)
-
-    timeline_path = results_dir / "execution_timeline.json"
-    _plot_execution_timeline_ax(ax4, timeline_path, results_dir)
-
-    plt.tight_layout()
+    _plot_backbone_comparison_ax(ax1, ctx.best_df)
+    _plot_predicted_vs_observed_ax(ax2, ctx.results_dir, ctx.best_model_info, ctx.data_df,
+                                   model_data=ctx.model_data)
+    _plot_head_model_table_ax(ax3, ctx.all_df)
 
-    # Save figures
-    save_for_pub(fig, output_prefix, include_raster=True)
-
-    plt.close(fig)
-
-    return f"{output_prefix}.png"
+    timeline_path = ctx.results_dir / "execution_timeline.json"
+    _plot_execution_timeline_ax(ax4, timeline_path, ctx.results_dir)
 
 
 # Internal functions for combined figure (take ax parameter)
@@ -779,8 +874,8 @@ def _plot_backbone_comparison_ax(ax, best_df):
     """Internal: Plot backbone comparison on given axis."""
     best_df = best_df.sort_values('mean_cv_spearman', ascending=False)
     methods = best_df['backbone'].tolist()
-    spearman = best_df['mean_cv_spearman'].tolist()
-    spearman_std = best_df['std_cv_spearman'].tolist()
+    spearman = best_df['mean_cv_spearman'].to_numpy()
+    spearman_std = best_df['std_cv_spearman'].to_numpy()
     colors = [CAT_PALETTE[i % len(CAT_PALETTE)] for i in range(len(methods))]
     x_pos = np.arange(len(methods))
     ax.bar(x_pos, spearman, color=colors, alpha=0.9, width=0.6)
@@ -789,25 +884,17 @@ def _plot_backbone_comparison_ax(ax, best_df):
     ax.set_title('Model Performance Comparison', fontsize=12, fontweight='bold', pad=10)
     ax.set_ylabel('Spearman ρ (5-fold CV)', fontsize=10)
     ax.set_xticks(x_pos)
-    max_with_error = max(s + e for s, e in zip(spearman, spearman_std))
+    max_with_error = float(np.add(spearman, spearman_std).max())
     ax.set_ylim([0, max_with_error * 1.15])
     ax.yaxis.grid(True, linestyle='--', alpha=0.4)
-    labels = []
-    for m in methods:
-        if m == 'EV+OneHot':
-            labels.append('EV+OneHot')
-        elif m == 'ESM2-650M':
-            labels.append('ESM2\n650M')
-        elif m == 'ESM2-3B':
-            labels.append('ESM2\n3B')
-        else:
-            labels.append(m)
+    labels = [LABEL_MAP.get(m, m) for m in methods]
     ax.set_xticklabels(labels, fontsize=9, rotation=45, ha='right')
 
 
-def _plot_predicted_vs_observed_ax(ax, results_dir, best_model_info, data_df):
+def _plot_predicted_vs_observed_ax(ax, results_dir, best_model_info, data_df, model_data=None):
     """Internal: Plot predicted vs observed on given axis."""
-    model_data = load_model_predictions(results_dir, best_model_info, data_df)
+    if model_data is None:
+        model_data = load_model_predictions(results_dir, best_model_info, data_df)
     if model_data is not None:
         predicted, observed, actual_rho, model_name = model_data
         n_samples = len(observed)
@@ -817,18 +904,19 @@ def _plot_predicted_vs_observed_ax(ax, results_dir, best_model_info, data_df):
         rho = best_model_info['mean_cv_spearman']
         np.random.seed(42)
         noise = np.random.randn(n_samples)
-        predicted = rho * stats.zscore(observed) + np.sqrt(1 - rho**2) * noise
-        predicted = predicted * np.std(observed) + np.mean(observed)
+        # z-score observed once and scale the mix straight back to its units
+        obs_mean, obs_std = observed.mean(), observed.std()
+        z = (observed - obs_mean) / obs_std
+        predicted = (rho * z + np.sqrt(1 - rho * rho) * noise) * obs_std + obs_mean
         actual_rho = rho
         if best_model_info['head'] != 'ridge':
             model_name = f"{best_model_info['backbone']} ({best_model_info['head'].upper()})"
         else:
             model_name = "EV+OneHot (Ridge)"
-    ax.scatter(predicted, observed, c=CAT_PALETTE[0], alpha=0.5, s=15, edgecolors='none')
-    z = np.polyfit(predicted, observed, 1)
-    p = np.poly1d(z)
-    x_line = np.linspace(predicted.min(), predicted.max(), 100)
-    ax.plot(x_line, p(x_line), 'k--', alpha=0.5, linewidth=1)
+    plot_prediction_points(ax, predicted, observed)
+    slope, intercept = linear_fit(predicted, observed)
+    x_line = np.array([predicted.min(), predicted.max()])
+    ax.plot(x_line, slope * x_line + intercept, 'k--', alpha=0.5, linewidth=1)
     ax.set_title('Predicted vs Observed', fontsize=12, fontweight='bold', pad=10)
     ax.set_xlabel('Predicted', fontsize=10)
     ax.set_ylabel('Observed Fitness', fontsize=10)
@@ -841,16 +929,18 @@ def _plot_head_model_table_ax(ax, all_df):
     """Internal: Plot head model table on given axis."""
     ax.axis('off')
     ax.set_title('Head Model Comparison', fontsize=12, fontweight='bold', pad=10)
-    plm_df = all_df[~all_df['backbone'].str.contains('EV|OneHot', case=False, na=False)].copy()
+    plm_df = all_df[~all_df['backbone'].isin(EV_BACKBONES)].copy()
     if plm_df.empty:
         ax.text(0.5, 0.5, 'No pLM results available', ha='center', va='center',
                 transform=ax.transAxes, fontsize=10)
         return
-    pivot_df = plm_df.pivot(index='backbone', columns='head', values='mean_cv_spearman')
+    pivot_df = plm_df.pivot(index='backbone', columns='head', values='mean_cv_spearman').sort_index()
     head_order = ['svr', 'xgboost', 'knn']
     cols = [c for c in head_order if c in pivot_df.columns]
     pivot_df = pivot_df[cols]
-    best_per_row = pivot_df.idxmax(axis=1)
+    scores = pivot_df.to_numpy()
+    best_col_idx = np.nanargmax(scores, axis=1)
+    best_row_i, best_col_i = np.unravel_index(np.nanargmax(scores), scores.shape)
     n_rows = len(pivot_df) + 1
     n_cols = len(cols) + 1
     table = ax.table(cellText=[['']*n_cols for _ in range(n_rows)],
@@ -863,15 +953,14 @@ def _plot_head_model_table_ax(ax, all_df):
     for i, (backbone, row) in enumerate(pivot_df.iterrows()):
         cell = table[(i+1, 0)]
         cell.set_text_props(text=backbone, fontsize=9)
-        best_head = best_per_row[backbone]
         for j, col in enumerate(cols):
             cell = table[(i+1, j+1)]
             val = row[col]
             cell.set_text_props(text=f'{val:.2f}', fontsize=9)
-            if col == best_head:
+            if j == best_col_idx[i]:
                 cell.set_facecolor('#FFF3CD')
-    best_backbone = pivot_df.max(axis=1).idxmax()
-    best_head_overall = best_per_row[best_backbone]
+    best_backbone = pivot_df.index[best_row_i]
+    best_head_overall = cols[best_col_i]
     ax.text(0.5, 0.02, f'Best: {best_backbone} + {best_head_overall.upper()}',
             ha='center', va='bottom', transform=ax.transAxes, fontsize=9, fontweight='bold')
     table.auto_set_font_size(False)
@@ -16,20 +16,48 @@ Each figure is saved as a separate file.
 """
 
 import argparse
+import functools
+import hashlib
+import importlib.util
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import List
 
 import matplotlib
 matplotlib.use('Agg')
+# Split long paths so Agg renders them in bounded chunks
+matplotlib.rcParams['agg.path.chunksize'] = 10000
 import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.colors import LinearSegmentedColormap, to_rgba, to_rgba_array
 import numpy as np
 import pandas as pd
-import seaborn as sns
+from PIL import Image
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy path is used instead
+    njit = None
+
+# pyarrow is optional; without it the design CSV is parsed on every run
+HAVE_PARQUET = importlib.util.find_spec('pyarrow') is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _sns():
+    """Import seaborn on first use; it is only needed for styling and palettes."""
+    import seaborn as sns
+    return sns
+
+
+@functools.lru_cache(maxsize=1)
+def cat_palette():
+    """Categorical (colorblind-safe) palette."""
+    return _sns().color_palette('colorblind')
+
 
 # Color palettes
-CAT_PALETTE = sns.color_palette('colorblind')
 GRAY = [0.5, 0.5, 0.5]
 
 # Custom colormap (red-yellow-green)
@@ -45,6 +73,65 @@ THRESHOLDS = {
     'delta_SASA': 400,    # Higher is better
 }
 
+# Metrics shown in the statistics table and correlation heatmap
+SUMMARY_METRICS = ['pTM', 'iPTM', 'pAE', 'H_bonds', 'delta_SASA']
+
+# Metrics shown in the quality boxplots: (column, axis label)
+BOXPLOT_METRICS = [('pTM', 'pTM'), ('iPTM', 'iPTM'), ('pAE', 'pAE'), ('H_bonds', 'H-bonds')]
+
+# Design status codes and their labels
+STATUS_FAILED, STATUS_PASSED, STATUS_UNKNOWN = 0, 1, 2
+STATUS_LABELS = np.array(['Failed', 'Passed', 'Unknown'], dtype=object)
+
+# Table cell colors indexed by status code
+STATUS_CELL_COLORS = np.array(['#FFB6C1', '#90EE90', '#FFB6C1'], dtype=object)
+
+# Metrics where a lower value is better
+LOWER_IS_BETTER = {'pAE'}
+
+# Standardized metric name -> BoltzGen CSV column
+METRIC_COLUMNS = [
+    # Structure quality metrics
+    ('pTM', 'design_ptm'),
+    ('iPTM', 'design_to_target_iptm'),
+    ('pAE', 'min_design_to_target_pae'),
+    # Interface metrics
+    ('H_bonds', 'plip_hbonds_refolded'),
+    ('delta_SASA', 'delta_sasa_refolded'),
+    # Liability metrics
+    ('liability_score', 'liability_score'),
+    ('liability_violations', 'liability_num_violations'),
+    # RMSD
+    ('filter_rmsd', 'filter_rmsd'),
+    # Pre-computed scores from BoltzGen
+    ('quality_score', 'quality_score'),
+    ('final_rank', 'final_rank'),
+]
+
+# Heatmap row normalization modes
+NORM_IDENTITY, NORM_INV_MINMAX, NORM_CAP10, NORM_MINMAX = 0, 1, 2, 3
+
+# Heatmap rows: (metric column, row label, normalization mode)
+HEATMAP_ROWS = [
+    ('pTM', 'pTM', NORM_IDENTITY),
+    ('iPTM', 'iPTM', NORM_IDENTITY),
+    ('pAE', 'pAE (inv)', NORM_INV_MINMAX),
+    ('H_bonds', 'H-bonds', NORM_CAP10),    # Capped at 10
+    ('delta_SASA', 'delta SASA', NORM_MINMAX),
+]
+HEATMAP_COLUMNS = [col for col, _, _ in HEATMAP_ROWS]
+
+# Scatter plots with at least this many designs are rasterized inside PDFs;
+# below it the vector markers are both smaller and faster to write
+RASTERIZE_MIN_DESIGNS = 20000
+
+# Output formats; vector PDF is much slower to write, so it is opt-in (--pdf)
+DEFAULT_FORMATS = ('png',)
+
+# zlib level for PNG output; level 1 writes several times faster than the
+# default level 6 for slightly larger files
+PNG_COMPRESS_LEVEL = 1
+
 # Figure size for individual figures
 FIGSIZE = (5, 4)
 FIGSIZE_WIDE = (5, 4)
@@ -61,31 +148,160 @@ def prettify_ax(ax):
     ax.set_axisbelow(True)
 
 
-def simple_ax(figsize=FIGSIZE, **kwargs):
+def new_figure(figsize, fig=None):
+    """A constrained-layout figure, or `fig` cleared and reset for reuse.
+
+    Reusing one Figure for a run of plots skips creating and tearing down
+    a figure manager and canvas per plot.
+    """
+    if fig is None:
+        return plt.figure(figsize=figsize, constrained_layout=True)
+    fig.clear()
+    fig.set_size_inches(figsize)
+    fig.set_dpi(plt.rcParams['figure.dpi'])
+    fig.patch.set_facecolor(plt.rcParams['figure.facecolor'])
+    fig.patch.set_edgecolor(plt.rcParams['figure.edgecolor'])
+    fig.set_layout_engine('constrained')
+    return fig
+
+
+def simple_ax(figsize=FIGSIZE, fig=None, **kwargs):
     """Shortcut to make and 'prettify' a simple figure with 1 axis"""
-    fig = plt.figure(figsize=figsize)
+    fig = new_figure(figsize, fig)
     ax = fig.add_subplot(111, **kwargs)
     prettify_ax(ax)
     return fig, ax
 
 
+def add_reference_vlines(ax, lines, linewidth=2):
+    """Draw full-height reference lines as one LineCollection.
+
+    `lines` is a list of (x, color, linestyle, label) tuples. Legend entries
+    come from empty proxy lines so the drawn lines stay a single artist.
+    """
+    if not lines:
+        return
+    xs, colors, styles, labels = zip(*lines)
+    ax.vlines(xs, 0, 1, transform=ax.get_xaxis_transform(),
+              colors=list(colors), linestyles=list(styles), linewidth=linewidth)
+    for color, style, label in zip(colors, styles, labels):
+        ax.plot([], [], color=color, linestyle=style, linewidth=linewidth, label=label)
+
+
+def annotate_cells(ax, data, text_colors, fmt='%.2f', **text_kw):
+    """Write each cell value of an imshow grid at its center.
+
+    Labels and colors are prepared as whole arrays, leaving a single pass
+    of ax.text calls.
+    """
+    labels = np.char.mod(fmt, data)
+    for (i, j), label in np.ndenumerate(labels):
+        ax.text(j, i, label, ha='center', va='center', color=text_colors[i, j], **text_kw)
+
+
+def draw_table_image(ax, cell_text, col_labels, cell_colors, col_widths,
+                     header_color='#404040', fontsize=9):
+    """Draw a small table as one colour image with grid lines and text.
+
+    Replaces ax.table, whose Rectangle and Text artist per cell dominates the
+    draw time of a panel. Columns keep their relative widths by repeating
+    each colour column in proportion to col_widths.
+    """
+    n_rows, n_cols = len(cell_text) + 1, len(col_labels)
+    colors = np.empty((n_rows, n_cols), dtype=object)
+    colors[0] = header_color
+    colors[1:] = cell_colors
+    rgba = to_rgba_array(colors.ravel()).reshape(n_rows, n_cols, 4)
+    units = np.rint(np.asarray(col_widths) * 100).astype(int)
+    edges = np.concatenate(([0], np.cumsum(units)))
+    ax.imshow(np.repeat(rgba, units, axis=1), extent=(0, edges[-1], n_rows, 0),
+              aspect='auto', interpolation='nearest')
+    ax.hlines(np.arange(n_rows + 1), 0, edges[-1], color='black', linewidth=1)
+    ax.vlines(edges, 0, n_rows, color='black', linewidth=1)
+
+    centers = (edges[:-1] + edges[1:]) / 2
+    for x, label in zip(centers, col_labels):
+        ax.text(x, 0.5, label, ha='center', va='center', color='white',
+                fontweight='bold', fontsize=fontsize)
+    for i, row in enumerate(cell_text, start=1):
+        for x, value in zip(centers, row):
+            ax.text(x, i + 0.5, value, ha='center', va='center', fontsize=fontsize)
+
+    margin = n_rows * 0.35
+    ax.set_xlim(-1, edges[-1] + 1)
+    ax.set_ylim(n_rows + margin, -margin)
+    ax.axis('off')
+
+
 def set_pub_plot_context(context="talk"):
     """Set publication-quality plot context"""
-    sns.set(style="white", context=context)
+    _sns().set(style="white", context=context)
 
 
-def save_for_pub(fig, path, dpi=300, include_raster=True):
-    """Save figure in publication-ready formats"""
-    fig.savefig(path + ".pdf", dpi=dpi, bbox_inches='tight', transparent=True)
-    if include_raster:
-        fig.savefig(path + ".png", dpi=dpi, bbox_inches='tight', transparent=True)
+def freeze_layout(fig):
+    """Solve the layout once and pin axes positions for the following saves.
 
+    Without this, every savefig call re-runs the layout engine.
+    """
+    if fig.get_layout_engine() is not None:
+        fig.draw_without_rendering()
+        fig.set_layout_engine('none')
 
-def load_design_data(results_dir: Path) -> pd.DataFrame:
-    """Load nanobody design data from results directory.
 
-    Args:
-        results_dir: Path to results directory
+def tight_bbox(fig, pad_inches=0.1):
+    """Measure the tight bounding box once so every saved format can reuse it.
+
+    Passing bbox_inches='tight' instead makes each savefig call do an extra
+    measuring draw.
+    """
+    return fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad_inches)
+
+
+def write_png(fig, path, dpi, transparent=False, pad_inches=0.1):
+    """Draw the figure once with Agg and write the PNG from the canvas buffer.
+
+    The same draw solves the layout, which is then frozen, and measures the
+    tight bounding box; it is returned (in inches) so vector formats saved
+    afterwards crop identically without another layout pass.
+    """
+    if transparent:
+        for patch in [fig.patch] + [ax.patch for ax in fig.axes]:
+            patch.set_facecolor('none')
+            patch.set_edgecolor('none')
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    fig.set_layout_engine('none')
+    bbox = tight_bbox(fig, pad_inches)
+
+    # Copy the tight box out of the buffer (Agg rows run top to bottom); the
+    # padding may reach past the canvas, where it takes the figure background
+    buf = np.asarray(fig.canvas.buffer_rgba())
+    height, width = buf.shape[:2]
+    x0, y0, x1, y1 = np.rint(bbox.extents * dpi).astype(int)
+    top, left = height - y1, x0
+    out = np.empty((y1 - y0, x1 - x0, 4), dtype=np.uint8)
+    out[:] = np.rint(np.asarray(to_rgba(fig.patch.get_facecolor())) * 255)
+    src_rows = slice(max(top, 0), min(height - y0, height))
+    src_cols = slice(max(left, 0), min(x1, width))
+    out[src_rows.start - top:src_rows.stop - top, src_cols.start - left:src_cols.stop - left] = buf[src_rows, src_cols]
+    Image.fromarray(out).save(path, compress_level=PNG_COMPRESS_LEVEL, dpi=(dpi, dpi))
+    return bbox
+
+
+def save_for_pub(fig, path, dpi=300, formats=DEFAULT_FORMATS):
+    """Save figure in publication-ready formats (e.g. ('png', 'pdf'))"""
+    if 'png' in formats:
+        bbox = write_png(fig, f"{path}.png", dpi, transparent=True)
+    else:
+        freeze_layout(fig)
+        bbox = tight_bbox(fig)
+    for ext in formats:
+        if ext != 'png':
+            fig.savefig(f"{path}.{ext}", dpi=dpi, bbox_inches=bbox, transparent=True)
+
+
+def find_design_csv(results_dir: Path) -> Path:
+    """Locate the nanobody design metrics CSV in a results directory.
 
     Looks for:
     1. designs/final_ranked_designs/all_designs_metrics.csv
@@ -98,100 +314,360 @@ def load_design_data(results_dir: Path) -> pd.DataFrame:
 
     for csv_path in search_paths:
         if csv_path.exists():
-            df = pd.read_csv(csv_path)
-            print(f"Loaded {len(df)} designs from {csv_path}")
-            return df
+            return csv_path
 
     raise FileNotFoundError(f"No design stats CSV found in {results_dir}")
 
 
+# Parsed design CSVs keyed by (path, mtime, size), for repeated calls in one session
+_DATA_CACHE = {}
+
+
+def read_design_csv(csv_path: Path, stat: os.stat_result) -> pd.DataFrame:
+    """Parse the design CSV, going through a Parquet sidecar when pyarrow is available.
+
+    The sidecar sits next to the CSV and is named after its mtime and size,
+    so a rewritten CSV misses the old copy, which is then replaced.
+    """
+    if not HAVE_PARQUET:
+        return pd.read_csv(csv_path)
+
+    tag = hashlib.md5(f'{stat.st_mtime_ns}:{stat.st_size}'.encode()).hexdigest()[:12]
+    sidecar = csv_path.with_name(f'.{csv_path.stem}.{tag}.parquet')
+    if sidecar.exists():
+        return pd.read_parquet(sidecar, memory_map=True)
+
+    df = pd.read_csv(csv_path)
+    # Write under a temporary name and rename, so an interrupted or failed
+    # write never leaves a truncated sidecar for the next run to trust
+    tmp = sidecar.with_name(f'{sidecar.name}.{os.getpid()}.tmp')
+    try:
+        for stale in csv_path.parent.glob(f'.{csv_path.stem}.*.parquet'):
+            stale.unlink()
+        df.to_parquet(tmp, compression='zstd')
+        os.replace(tmp, sidecar)
+    except (OSError, ValueError, TypeError):
+        # Read-only results directory or a column pyarrow cannot store;
+        # just skip the cache
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return df
+
+
+def load_design_data(results_dir: Path) -> pd.DataFrame:
+    """Load nanobody design data from results directory.
+
+    Repeated calls (e.g. from a notebook) reuse the parsed table until the
+    CSV changes on disk; across runs, a Parquet copy avoids re-parsing it.
+
+    Args:
+        results_dir: Path to results directory
+    """
+    csv_path = find_design_csv(results_dir)
+    stat = csv_path.stat()
+    key = (str(csv_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    if key not in _DATA_CACHE:
+        _DATA_CACHE.clear()  # Keep only the latest table
+        _DATA_CACHE[key] = read_design_csv(csv_path, stat)
+    df = _DATA_CACHE[key].copy(deep=False)
+    print(f"Loaded {len(df)} designs from {csv_path}")
+    return df
+
+
+def outputs_up_to_date(targets: List[str], sources: List[Path]) -> bool:
+    """Return True if every target exists and is newer than all sources."""
+    newest_source = max(Path(src).stat().st_mtime for src in sources)
+    return all(Path(t).exists() and Path(t).stat().st_mtime >= newest_source for t in targets)
+
+
+def metrics_signature(metrics: pd.DataFrame) -> str:
+    """Content hash of the metrics table and this script.
+
+    Changes whenever a value, column or plotting code changes, but not when
+    the CSV is merely rewritten with identical data.
+    """
+    digest = hashlib.sha1()
+    digest.update(pd.util.hash_pandas_object(metrics, index=True).to_numpy().tobytes())
+    digest.update('\0'.join(metrics.columns).encode())
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def read_signature(cache_path: Path) -> str:
+    """Return the signature stored next to the figures, or None."""
+    try:
+        return json.loads(cache_path.read_text()).get('signature')
+    except (OSError, ValueError):
+        return None
+
+
 def extract_metrics(df: pd.DataFrame) -> pd.DataFrame:
     """Extract and standardize key metrics from nanobody design dataframe.
 
     Maps nanobody-specific columns to standardized metric names for visualization.
     """
-    metrics = pd.DataFrame()
+    cols = set(df.columns)
+    data = {}
 
     # Design identifier
-    if 'id' in df.columns:
-        metrics['Design'] = df['id']
-    elif 'file_name' in df.columns:
-        metrics['Design'] = df['file_name']
+    id_col = next((c for c in ('id', 'file_name') if c in cols), None)
+    if id_col is not None:
+        data['Design'] = df[id_col].to_numpy()
     else:
-        metrics['Design'] = [f'design_{i:03d}' for i in range(1, len(df) + 1)]
+        data['Design'] = [f'design_{i:03d}' for i in range(1, len(df) + 1)]
 
-    # Status from pass_filters
-    if 'pass_filters' in df.columns:
-        metrics['Status'] = df['pass_filters'].apply(lambda x: 'Passed' if x else 'Failed')
+    # Status from pass_filters, stored as a categorical over the status codes
+    if 'pass_filters' in cols:
+        codes = df['pass_filters'].to_numpy(dtype=bool).astype(np.int8)  # False/True -> Failed/Passed
     else:
-        metrics['Status'] = 'Unknown'
+        codes = np.full(len(df), STATUS_UNKNOWN, dtype=np.int8)
+    data['Status'] = pd.Categorical.from_codes(codes, categories=STATUS_LABELS)
 
-    # Structure quality metrics
-    if 'design_ptm' in df.columns:
-        metrics['pTM'] = df['design_ptm']
+    for out, src in METRIC_COLUMNS:
+        if src in cols:
+            data[out] = df[src].to_numpy()
 
-    if 'design_to_target_iptm' in df.columns:
-        metrics['iPTM'] = df['design_to_target_iptm']
+    return pd.DataFrame(data, index=df.index)
 
-    if 'min_design_to_target_pae' in df.columns:
-        metrics['pAE'] = df['min_design_to_target_pae']
 
-    # Interface metrics
-    if 'plip_hbonds_refolded' in df.columns:
-        metrics['H_bonds'] = df['plip_hbonds_refolded']
+def pae_quality(pae: np.ndarray) -> np.ndarray:
+    """Invert pAE for coloring (lower pAE = better = higher score), capped at >=30."""
+    pae_max = max(pae.max(), 30)
+    out = np.clip(pae, 0, pae_max) / pae_max
+    return np.subtract(1, out, out=out)
+
+
+def _summarize_numpy(values, modes, thresholds, higher):
+    """NumPy fallback for the metric summary kernel."""
+    norm = np.empty(values.shape)
+    for r in range(values.shape[0]):
+        row = values[r]
+        if modes[r] == NORM_IDENTITY:
+            norm[r] = row
+        elif modes[r] == NORM_CAP10:
+            norm[r] = np.clip(row, 0, 10) / 10
+        else:
+            # Scale to 0-1; inverted rows score lower raw values higher
+            norm[r] = (row - row.min()) / (row.max() - row.min() + 1e-6)
+            if modes[r] == NORM_INV_MINMAX:
+                norm[r] = 1 - norm[r]
+
+    passes = np.where(higher[:, None], values >= thresholds[:, None], values <= thresholds[:, None])
+    return norm, passes.sum(axis=1).astype(np.int32)
+
+
+def _summarize_loops(values, modes, thresholds, higher):
+    """Single pass per metric row: min/max, normalization and threshold counts."""
+    n_rows, n_designs = values.shape
+    norm = np.empty((n_rows, n_designs))
+    counts = np.zeros(n_rows, np.int32)
+
+    for r in range(n_rows):
+        # A NaN anywhere makes the range NaN, as with ndarray.min/max
+        lo = values[r, 0]
+        hi = values[r, 0]
+        for j in range(1, n_designs):
+            v = values[r, j]
+            if np.isnan(v):
+                lo = hi = np.nan
+                break
+            if v < lo:
+                lo = v
+            elif v > hi:
+                hi = v
+        span = hi - lo + 1e-6
 
-    if 'delta_sasa_refolded' in df.columns:
-        metrics['delta_SASA'] = df['delta_sasa_refolded']
+        for j in range(n_designs):
+            v = values[r, j]
+            if modes[r] == NORM_IDENTITY:
+                norm[r, j] = v
+            elif modes[r] == NORM_CAP10:
+                norm[r, j] = v / 10 if np.isnan(v) else min(max(v, 0.0), 10.0) / 10
+            elif modes[r] == NORM_INV_MINMAX:
+                norm[r, j] = 1 - (v - lo) / span
+            else:
+                norm[r, j] = (v - lo) / span
 
-    # Liability metrics
-    if 'liability_score' in df.columns:
-        metrics['liability_score'] = df['liability_score']
+            if (higher[r] and v >= thresholds[r]) or (not higher[r] and v <= thresholds[r]):
+                counts[r] += 1
 
-    if 'liability_num_violations' in df.columns:
-        metrics['liability_violations'] = df['liability_num_violations']
+    return norm, counts
 
-    # RMSD
-    if 'filter_rmsd' in df.columns:
-        metrics['filter_rmsd'] = df['filter_rmsd']
 
-    # Pre-computed scores from BoltzGen
-    if 'quality_score' in df.columns:
-        metrics['quality_score'] = df['quality_score']
+# Compiled kernel for large batches when numba is available
+_summarize_kernel = njit(cache=True)(_summarize_loops) if njit is not None else _summarize_numpy
+
+
+def summarize_metrics(metrics: pd.DataFrame) -> dict:
+    """Normalize heatmap rows and count threshold passes for all designs.
+
+    Returns a dict with the metric 'columns', heatmap row 'labels', the
+    normalized 'norm' matrix (rows x designs), per-metric threshold 'counts'
+    and the inverted pAE 'pae_quality' used to color the pTM/iPTM scatter.
+    """
+    present = set(present_columns(metrics, HEATMAP_COLUMNS))
+    rows = [row for row in HEATMAP_ROWS if row[0] in present]
+    columns = [col for col, _, _ in rows]
+
+    values = np.empty((len(rows), len(metrics)))
+    for r, col in enumerate(columns):
+        values[r] = metrics[col].to_numpy(dtype=np.float64)
+
+    if len(metrics) == 0:
+        norm, counts = values.copy(), np.zeros(len(rows), np.int32)
+    else:
+        modes = np.array([mode for _, _, mode in rows], dtype=np.int64)
+        thresholds = np.array([THRESHOLDS[col] for col in columns], dtype=np.float64)
+        higher = np.array([col not in LOWER_IS_BETTER for col in columns], dtype=np.bool_)
+        norm, counts = _summarize_kernel(values, modes, thresholds, higher)
+
+    pae = values[columns.index('pAE')] if 'pAE' in columns else np.ones(len(metrics)) * 10
+
+    return {
+        'columns': columns,
+        'labels': [label for _, label, _ in rows],
+        'norm': norm,
+        'counts': counts,
+        'pae_quality': pae_quality(pae) if len(metrics) > 0 else pae,
+    }
+
+
+def present_columns(metrics: pd.DataFrame, candidates) -> List[str]:
+    """The candidate columns found in `metrics`, in candidate order.
+
+    Intersects the column sets once instead of probing the Index per name.
+    """
+    found = set(metrics.columns).intersection(candidates)
+    return [col for col in candidates if col in found]
+
+
+def column_values(metrics: pd.DataFrame, col: str, fill=0) -> np.ndarray:
+    """Column as a NumPy array, or `fill` repeated when the column is missing."""
+    if col in metrics.columns:
+        return metrics[col].to_numpy()
+    return np.full(len(metrics), fill)
+
+
+def status_codes(metrics: pd.DataFrame) -> np.ndarray:
+    """Per-design status codes (STATUS_FAILED/PASSED/UNKNOWN) as int8.
+
+    Panels test status through these codes rather than comparing labels.
+    """
+    if 'Status' not in metrics.columns:
+        return np.full(len(metrics), STATUS_UNKNOWN, dtype=np.int8)
+    return metrics['Status'].cat.codes.to_numpy()
+
+
+def design_names(metrics: pd.DataFrame) -> np.ndarray:
+    """Design identifiers, falling back to design_001, design_002, ..."""
+    if 'Design' in metrics.columns:
+        return metrics['Design'].to_numpy()
+    return np.array([f'design_{i:03d}' for i in range(1, len(metrics) + 1)])
+
+
+def compute_rank_key(metrics: pd.DataFrame) -> np.ndarray:
+    """Ranking key for designs (lower is better).
+
+    Status comes first (Passed before Failed), then final_rank, or the
+    negated quality_score, or the original order.
+    """
+    if 'final_rank' in metrics.columns:
+        rank_values = metrics['final_rank'].to_numpy(dtype=np.float64)
+    elif 'quality_score' in metrics.columns:
+        rank_values = -metrics['quality_score'].to_numpy(dtype=np.float64)  # Negate for descending order
+    else:
+        rank_values = np.arange(len(metrics), dtype=np.float64)
+
+    # Status offset: Passed=0, otherwise 1000
+    passed = status_codes(metrics) == STATUS_PASSED
+    return np.where(passed, 0.0, 1000.0) + rank_values
 
-    if 'final_rank' in df.columns:
-        metrics['final_rank'] = df['final_rank']
 
-    return metrics
+def top_k_indices(rank_key: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k lowest rank keys, best first, without a full sort."""
+    k = min(k, len(rank_key))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    part = np.argpartition(rank_key, k - 1)[:k]
+    return part[np.argsort(rank_key[part], kind='stable')]
 
 
-def plot_quality_score_distribution(metrics: pd.DataFrame, output_path: str = None):
+def top_designs(metrics: pd.DataFrame, rank_key: np.ndarray, k: int = 5) -> dict:
+    """Best k designs by rank key, as arrays of design, status and table metrics."""
+    idx = top_k_indices(rank_key, k)
+    codes = status_codes(metrics)[idx]
+    top = {
+        'Design': design_names(metrics)[idx],
+        'Status': STATUS_LABELS[codes],
+        'status_code': codes,
+    }
+    for col in ('pTM', 'iPTM', 'pAE', 'H_bonds'):
+        top[col] = column_values(metrics, col)[idx]
+    return top
+
+
+def status_row_colors(codes: np.ndarray, n_cols: int) -> np.ndarray:
+    """Table cell colors as an (n, n_cols) array: green for Passed designs, pink otherwise."""
+    colors = np.empty((len(codes), n_cols), dtype=object)
+    colors[:] = STATUS_CELL_COLORS[codes][:, None]
+    return colors
+
+
+def split_quality_scores(metrics: pd.DataFrame):
+    """Quality scores plus the Passed/Failed subsets used by the histograms.
+
+    Returns (scores, passed_scores, failed_scores, has_failed).
+    """
+    scores = metrics['quality_score'].to_numpy()
+    codes = status_codes(metrics)
+    failed = codes == STATUS_FAILED
+    return scores, scores[codes == STATUS_PASSED], scores[failed], failed.any()
+
+
+def summary_values(metrics: pd.DataFrame):
+    """SUMMARY_METRICS present in `metrics` and their values as one (n, k) float array.
+
+    The merged figure builds this once and shares it between the panels that
+    read the same columns.
+    """
+    present = present_columns(metrics, SUMMARY_METRICS)
+    return present, metrics[present].to_numpy(dtype=np.float64)
+
+
+def metric_statistics_rows(present: List[str], values: np.ndarray) -> List[List[str]]:
+    """Formatted [metric, mean, std, min, max] rows for the statistics tables."""
+    if not present:
+        return []
+
+    # Reduce each statistic across all designs at once on the (k, n) view
+    arr = values.T
+    stats = np.stack([arr.mean(axis=1), arr.std(axis=1), arr.min(axis=1), arr.max(axis=1)], axis=1)
+    return [[metric] + [f'{val:.2f}' for val in row] for metric, row in zip(present, stats)]
+
+
+def plot_quality_score_distribution(metrics: pd.DataFrame, output_path: str = None,
+                                    formats: tuple = DEFAULT_FORMATS, fig: plt.Figure = None):
     """
     Plot 1: Quality score distribution histogram.
     Uses pre-computed quality_score from BoltzGen CSV.
     """
-    fig, ax = simple_ax(figsize=FIGSIZE)
+    fig, ax = simple_ax(figsize=FIGSIZE, fig=fig)
 
     if 'quality_score' not in metrics.columns:
         ax.text(0.5, 0.5, 'No quality_score data available',
                 ha='center', va='center', transform=ax.transAxes)
         if output_path:
-            save_for_pub(fig, output_path)
+            save_for_pub(fig, output_path, formats=formats)
         return fig
 
-    scores = metrics['quality_score'].values
-    status = metrics['Status'].values if 'Status' in metrics.columns else ['Unknown'] * len(metrics)
-    has_failed = 'Failed' in status
+    scores, passed_scores, failed_scores, has_failed = split_quality_scores(metrics)
 
     bins = np.linspace(0, 1, 11)
+    ref_lines = []
 
     if has_failed:
-        # Separate passed and failed scores
-        passed_mask = np.array(status) == 'Passed'
-        failed_mask = np.array(status) == 'Failed'
-
-        passed_scores = scores[passed_mask]
-        failed_scores = scores[failed_mask]
-
         # Create stacked histogram
         ax.hist([failed_scores, passed_scores], bins=bins, stacked=True,
                 color=['#d73027', '#1a9850'], alpha=0.8, edgecolor='white', linewidth=1,
@@ -201,13 +677,11 @@ def plot_quality_score_distribution(metrics: pd.DataFrame, output_path: str = No
         mean_passed = np.mean(passed_scores) if len(passed_scores) > 0 else 0
         mean_failed = np.mean(failed_scores) if len(failed_scores) > 0 else 0
 
-        # Add mean lines
+        # Collect mean lines
         if len(passed_scores) > 0:
-            ax.axvline(x=mean_passed, color='darkgreen', linestyle='-', linewidth=2,
-                       label=f'Mean Passed ({mean_passed:.2f})')
+            ref_lines.append((mean_passed, 'darkgreen', '-', f'Mean Passed ({mean_passed:.2f})'))
         if len(failed_scores) > 0:
-            ax.axvline(x=mean_failed, color='darkred', linestyle=':', linewidth=2,
-                       label=f'Mean Failed ({mean_failed:.2f})')
+            ref_lines.append((mean_failed, 'darkred', ':', f'Mean Failed ({mean_failed:.2f})'))
 
         # Add summary text
         summary = f"Passed: {len(passed_scores)} | Failed: {len(failed_scores)}"
@@ -217,21 +691,19 @@ def plot_quality_score_distribution(metrics: pd.DataFrame, output_path: str = No
     else:
         # Single histogram
         mean_score = np.mean(scores)
-        counts, bin_edges, patches = ax.hist(scores, bins=bins, color=CAT_PALETTE[0],
+        counts, bin_edges, patches = ax.hist(scores, bins=bins, color=cat_palette()[0],
                                               alpha=0.8, edgecolor='white', linewidth=1)
 
-        # Add count labels on bars
-        for count, patch in zip(counts, patches):
-            if count > 0:
-                x = patch.get_x() + patch.get_width() / 2
-                y = patch.get_height()
-                ax.text(x, y + 0.1, f'{int(count)}', ha='center', va='bottom', fontsize=10)
+        # Add count labels on non-empty bars
+        labels = [f'{int(count)}' if count > 0 else '' for count in counts]
+        ax.bar_label(patches, labels=labels, padding=2, fontsize=10)
 
-        # Add mean line
-        ax.axvline(x=mean_score, color='red', linestyle='-', linewidth=2, label=f'Mean ({mean_score:.2f})')
+        # Collect mean line
+        ref_lines.append((mean_score, 'red', '-', f'Mean ({mean_score:.2f})'))
 
-    # Add threshold line
-    ax.axvline(x=0.6, color='gray', linestyle='--', linewidth=2, label='Good threshold')
+    # Mean and threshold lines drawn together
+    ref_lines.append((0.6, 'gray', '--', 'Good threshold'))
+    add_reference_vlines(ax, ref_lines)
 
     # Add note about score source
     ax.text(0.5, 0.02, "Quality Score from BoltzGen", transform=ax.transAxes, fontsize=9,
@@ -242,39 +714,38 @@ def plot_quality_score_distribution(metrics: pd.DataFrame, output_path: str = No
     ax.set_xlim(0, 1)
     ax.legend(loc='upper left', fontsize=9)
 
-    plt.tight_layout()
-
     if output_path:
-        save_for_pub(fig, output_path)
+        save_for_pub(fig, output_path, formats=formats)
         print(f"Saved: {output_path}.png")
 
     return fig
 
 
-def plot_structure_quality_assessment(metrics: pd.DataFrame, output_path: str = None):
+def plot_structure_quality_assessment(metrics: pd.DataFrame, output_path: str = None,
+                                      summary: dict = None, formats: tuple = DEFAULT_FORMATS, fig: plt.Figure = None):
     """
     Plot 2: Structure quality assessment scatter plot (iPTM vs pTM).
     X-axis: iPTM (interface confidence)
     Y-axis: pTM (structure confidence)
     Color: pAE (inverted, lower is better)
     """
-    fig, ax = simple_ax(figsize=FIGSIZE_WIDE)
+    if summary is None:
+        summary = summarize_metrics(metrics)
 
-    # Get data
-    ptm = metrics['pTM'].values if 'pTM' in metrics.columns else np.zeros(len(metrics))
-    iptm = metrics['iPTM'].values if 'iPTM' in metrics.columns else np.zeros(len(metrics))
-    pae = metrics['pAE'].values if 'pAE' in metrics.columns else np.ones(len(metrics)) * 10
+    fig, ax = simple_ax(figsize=FIGSIZE_WIDE, fig=fig)
 
-    # Invert pAE for coloring (lower pAE = better = higher score)
-    pae_max = max(pae.max(), 30)
-    pae_inv = 1 - np.clip(pae, 0, pae_max) / pae_max
+    # Get data
+    ptm = column_values(metrics, 'pTM')
+    iptm = column_values(metrics, 'iPTM')
+    pae_inv = summary['pae_quality']
 
     # Small uniform dot size for clean appearance
     dot_size = 60
 
     # Plot all designs colored by inverted pAE
     scatter = ax.scatter(iptm, ptm, c=pae_inv, s=dot_size, cmap=RYG_CMAP,
-                        alpha=0.85, edgecolors='white', linewidth=0.8, vmin=0, vmax=1)
+                        alpha=0.85, edgecolors='white', linewidth=0.8, vmin=0, vmax=1,
+                        rasterized=len(metrics) >= RASTERIZE_MIN_DESIGNS)
 
     # Add colorbar
     cbar = plt.colorbar(scatter, ax=ax, shrink=0.8)
@@ -287,16 +758,15 @@ def plot_structure_quality_assessment(metrics: pd.DataFrame, output_path: str =
     ax.set_xlabel('iPTM (Interface Confidence)', fontsize=13)
     ax.set_ylabel('pTM (Structure Confidence)', fontsize=13)
 
-    plt.tight_layout()
-
     if output_path:
-        save_for_pub(fig, output_path)
+        save_for_pub(fig, output_path, formats=formats)
         print(f"Saved: {output_path}.png")
 
     return fig
 
 
-def plot_normalized_heatmap(metrics: pd.DataFrame, output_path: str = None):
+def plot_normalized_heatmap(metrics: pd.DataFrame, output_path: str = None, summary: dict = None,
+                            formats: tuple = DEFAULT_FORMATS, fig: plt.Figure = None):
     """
     Plot 3: Normalized metrics heatmap.
     Shows pTM, iPTM, pAE(inv), H_bonds, delta_SASA for each design.
@@ -306,53 +776,25 @@ def plot_normalized_heatmap(metrics: pd.DataFrame, output_path: str = None):
     design_labels = [str(i+1).zfill(3) for i in range(n_designs)]
 
     # Normalize metrics
-    data = []
-    row_labels = []
-
-    if 'pTM' in metrics.columns:
-        data.append(metrics['pTM'].values)
-        row_labels.append('pTM')
-
-    if 'iPTM' in metrics.columns:
-        data.append(metrics['iPTM'].values)
-        row_labels.append('iPTM')
-
-    if 'pAE' in metrics.columns:
-        pae = metrics['pAE'].values
-        pae_inv = 1 - (pae - pae.min()) / (pae.max() - pae.min() + 1e-6)
-        data.append(pae_inv)
-        row_labels.append('pAE (inv)')
-
-    if 'H_bonds' in metrics.columns:
-        hbonds = metrics['H_bonds'].values
-        hbonds_norm = np.clip(hbonds, 0, 10) / 10  # Cap at 10
-        data.append(hbonds_norm)
-        row_labels.append('H-bonds')
-
-    if 'delta_SASA' in metrics.columns:
-        sasa = metrics['delta_SASA'].values
-        sasa_norm = (sasa - sasa.min()) / (sasa.max() - sasa.min() + 1e-6)
-        data.append(sasa_norm)
-        row_labels.append('delta SASA')
-
-    data = np.array(data)
+    if summary is None:
+        summary = summarize_metrics(metrics)
+    data = summary['norm']
+    row_labels = summary['labels']
     n_rows = len(row_labels)
 
     # Calculate figure size to make heatmap region square
     cell_size = 0.6
     fig_width = n_designs * cell_size + 2.5
     fig_height = n_rows * cell_size + 1.5
-    fig, ax = plt.subplots(figsize=(fig_width, fig_height))
+    fig = new_figure((fig_width, fig_height), fig)
+    ax = fig.subplots()
 
     # Create heatmap with square cells
     im = ax.imshow(data, cmap=RYG_CMAP, aspect='equal', vmin=0, vmax=1)
 
     # Add text annotations
-    for i in range(len(row_labels)):
-        for j in range(n_designs):
-            text = f'{data[i, j]:.2f}'
-            color = 'white' if data[i, j] < 0.4 or data[i, j] > 0.7 else 'black'
-            ax.text(j, i, text, ha='center', va='center', fontsize=9, color=color)
+    text_colors = np.where((data < 0.4) | (data > 0.7), 'white', 'black')
+    annotate_cells(ax, data, text_colors, fontsize=9)
 
     # Set ticks
     ax.set_xticks(np.arange(n_designs))
@@ -364,36 +806,24 @@ def plot_normalized_heatmap(metrics: pd.DataFrame, output_path: str = None):
     cbar = plt.colorbar(im, ax=ax, shrink=0.8)
     cbar.set_label('Normalized Score (0-1)', fontsize=10)
 
-    plt.tight_layout()
-
     if output_path:
-        save_for_pub(fig, output_path)
+        save_for_pub(fig, output_path, formats=formats)
         print(f"Saved: {output_path}.png")
 
     return fig
 
 
-def plot_metrics_statistics_table(metrics: pd.DataFrame, output_path: str = None):
+def plot_metrics_statistics_table(metrics: pd.DataFrame, output_path: str = None,
+                                  formats: tuple = DEFAULT_FORMATS, fig: plt.Figure = None):
     """
     Plot 4: Metrics statistics table (Mean, Std, Min, Max).
     """
-    fig, ax = plt.subplots(figsize=(6, 3))
+    fig = new_figure((6, 3), fig)
+    ax = fig.subplots()
     ax.axis('off')
 
     # Calculate statistics
-    stats_data = []
-    metric_names = ['pTM', 'iPTM', 'pAE', 'H_bonds', 'delta_SASA']
-
-    for metric in metric_names:
-        if metric in metrics.columns:
-            values = metrics[metric].values
-            mean_val = np.mean(values)
-            std_val = np.std(values)
-            min_val = np.min(values)
-            max_val = np.max(values)
-
-            stats_data.append([metric, f'{mean_val:.2f}', f'{std_val:.2f}',
-                              f'{min_val:.2f}', f'{max_val:.2f}'])
+    stats_data = metric_statistics_rows(*summary_values(metrics))
 
     # Create table
     col_labels = ['Metric', 'Mean', 'Std', 'Min', 'Max']
@@ -417,29 +847,23 @@ def plot_metrics_statistics_table(metrics: pd.DataFrame, output_path: str = None
             if i % 2 == 0:
                 table[(i, j)].set_facecolor('#f0f0f0')
 
-    plt.tight_layout()
-
     if output_path:
-        save_for_pub(fig, output_path)
+        save_for_pub(fig, output_path, formats=formats)
         print(f"Saved: {output_path}.png")
 
     return fig
 
 
-def plot_quality_boxplot(metrics: pd.DataFrame, output_path: str = None):
+def plot_quality_boxplot(metrics: pd.DataFrame, output_path: str = None,
+                         formats: tuple = DEFAULT_FORMATS, fig: plt.Figure = None):
     """
     Plot 5: Quality statistics boxplot with threshold lines and outliers.
     """
-    fig, axes = plt.subplots(1, 4, figsize=(10, 4))
-
-    metric_configs = [
-        ('pTM', 'pTM', THRESHOLDS['pTM'], True),
-        ('iPTM', 'iPTM', THRESHOLDS['iPTM'], True),
-        ('pAE', 'pAE', THRESHOLDS['pAE'], False),
-        ('H_bonds', 'H-bonds', THRESHOLDS['H_bonds'], True),
-    ]
+    fig = new_figure((10, 4), fig)
+    axes = fig.subplots(1, 4)
 
-    for ax, (metric, label, threshold, higher_better) in zip(axes, metric_configs):
+    for ax, (metric, label) in zip(axes, BOXPLOT_METRICS):
+        threshold = THRESHOLDS[metric]
         if metric in metrics.columns:
             data = metrics[metric].values
 
@@ -447,7 +871,7 @@ def plot_quality_boxplot(metrics: pd.DataFrame, output_path: str = None):
             bp = ax.boxplot(data, patch_artist=True, widths=0.6, showfliers=True,
                            flierprops=dict(marker='o', markerfacecolor='red', markersize=6,
                                           markeredgecolor='darkred', alpha=0.7))
-            bp['boxes'][0].set_facecolor(CAT_PALETTE[0])
+            bp['boxes'][0].set_facecolor(cat_palette()[0])
             bp['boxes'][0].set_alpha(0.7)
 
             # Add threshold line
@@ -461,32 +885,32 @@ def plot_quality_boxplot(metrics: pd.DataFrame, output_path: str = None):
             ax.text(0.5, 0.5, f'No {metric} data', ha='center', va='center', transform=ax.transAxes)
             ax.axis('off')
 
-    plt.tight_layout()
-
     if output_path:
-        save_for_pub(fig, output_path)
+        save_for_pub(fig, output_path, formats=formats)
         print(f"Saved: {output_path}.png")
 
     return fig
 
 
-def plot_interface_metrics(metrics: pd.DataFrame, output_path: str = None):
+def plot_interface_metrics(metrics: pd.DataFrame, output_path: str = None,
+                           formats: tuple = DEFAULT_FORMATS, fig: plt.Figure = None):
     """
     Plot 6: Interface metrics scatter (H-bonds vs delta_SASA).
     X-axis: H_bonds
     Y-axis: delta_SASA
     Color: iPTM
     """
-    fig, ax = simple_ax(figsize=FIGSIZE)
+    fig, ax = simple_ax(figsize=FIGSIZE, fig=fig)
 
     # Get data
-    hbonds = metrics['H_bonds'].values if 'H_bonds' in metrics.columns else np.zeros(len(metrics))
-    sasa = metrics['delta_SASA'].values if 'delta_SASA' in metrics.columns else np.zeros(len(metrics))
-    iptm = metrics['iPTM'].values if 'iPTM' in metrics.columns else np.ones(len(metrics)) * 0.5
+    hbonds = column_values(metrics, 'H_bonds')
+    sasa = column_values(metrics, 'delta_SASA')
+    iptm = column_values(metrics, 'iPTM', 0.5)
 
     # Create scatter plot
     scatter = ax.scatter(hbonds, sasa, c=iptm, cmap='plasma',
-                        s=60, alpha=0.85, edgecolors='white', linewidth=0.8)
+                        s=60, alpha=0.85, edgecolors='white', linewidth=0.8,
+                        rasterized=len(metrics) >= RASTERIZE_MIN_DESIGNS)
 
     # Colorbar
     cbar = plt.colorbar(scatter, ax=ax, shrink=0.8)
@@ -499,70 +923,46 @@ def plot_interface_metrics(metrics: pd.DataFrame, output_path: str = None):
     ax.set_xlabel('H-bonds', fontsize=13)
     ax.set_ylabel('delta SASA', fontsize=13)
 
-    plt.tight_layout()
-
     if output_path:
-        save_for_pub(fig, output_path)
+        save_for_pub(fig, output_path, formats=formats)
         print(f"Saved: {output_path}.png")
 
     return fig
 
 
-def plot_top5_designs_table(metrics: pd.DataFrame, output_path: str = None):
+def plot_top5_designs_table(metrics: pd.DataFrame, output_path: str = None,
+                            rank_key: np.ndarray = None, formats: tuple = DEFAULT_FORMATS, fig: plt.Figure = None):
     """
     Plot 7: Top 5 designs table with metrics.
     Ranks by: 1) Status (Passed first), 2) quality_score or final_rank.
     """
-    fig, ax = plt.subplots(figsize=(6, 4))
+    fig = new_figure((6, 4), fig)
+    ax = fig.subplots()
     ax.axis('off')
 
-    # Get metrics for ranking
-    status = metrics['Status'].values if 'Status' in metrics.columns else ['Unknown'] * len(metrics)
-
-    # Use final_rank if available, otherwise quality_score
-    if 'final_rank' in metrics.columns:
-        rank_values = metrics['final_rank'].values
-    elif 'quality_score' in metrics.columns:
-        rank_values = -metrics['quality_score'].values  # Negate for descending order
-    else:
-        rank_values = np.arange(len(metrics))
-
-    # Create ranking: Status first (Passed=0, Failed=1), then by rank
-    status_score = np.array([0 if s == 'Passed' else 1 for s in status])
-    combined_rank = status_score * 1000 + rank_values
-
-    n_designs = min(5, len(metrics))
-    ranked_indices = np.argsort(combined_rank)[:n_designs]
-
-    # Prepare table data
-    table_data = []
-    colors = []
-    for rank, idx in enumerate(ranked_indices, 1):
-        design = metrics['Design'].iloc[idx] if 'Design' in metrics.columns else f'design_{idx+1:03d}'
-        ptm_val = metrics['pTM'].iloc[idx] if 'pTM' in metrics.columns else 0
-        iptm_val = metrics['iPTM'].iloc[idx] if 'iPTM' in metrics.columns else 0
-        pae_val = metrics['pAE'].iloc[idx] if 'pAE' in metrics.columns else 0
-        hbonds_val = metrics['H_bonds'].iloc[idx] if 'H_bonds' in metrics.columns else 0
-
-        # Get status
-        design_status = status[idx]
-
-        # Color based on status
-        if design_status == 'Passed':
-            row_color = ['#90EE90'] * 7
-        else:
-            row_color = ['#FFB6C1'] * 7
-
-        table_data.append([rank, design, f'{ptm_val:.2f}', f'{iptm_val:.2f}',
-                          f'{pae_val:.1f}', f'{int(hbonds_val)}', design_status])
-        colors.append(row_color)
+    if rank_key is None:
+        rank_key = compute_rank_key(metrics)
+    top = top_designs(metrics, rank_key)
+
+    # Prepare table data: format each column once, then zip into rows
+    n_top = len(top['Design'])
+    table_data = [list(row) for row in zip(
+        range(1, n_top + 1),
+        top['Design'],
+        np.char.mod('%.2f', top['pTM']),
+        np.char.mod('%.2f', top['iPTM']),
+        np.char.mod('%.1f', top['pAE']),
+        np.char.mod('%d', top['H_bonds']),
+        top['Status'],
+    )]
 
     # Create table
     col_labels = ['#', 'Design', 'pTM', 'iPTM', 'pAE', 'H-bonds', 'Status']
+    colors = status_row_colors(top['status_code'], len(col_labels))
 
     table = ax.table(cellText=table_data, colLabels=col_labels,
                      loc='center', cellLoc='center',
-                     cellColours=colors,
+                     cellColours=colors.tolist(),
                      colWidths=[0.06, 0.28, 0.10, 0.10, 0.10, 0.10, 0.12])
 
     # Style table
@@ -575,46 +975,50 @@ def plot_top5_designs_table(metrics: pd.DataFrame, output_path: str = None):
         table[(0, j)].set_facecolor('#404040')
         table[(0, j)].set_text_props(color='white', fontweight='bold')
 
-    plt.tight_layout()
-
     if output_path:
-        save_for_pub(fig, output_path)
+        save_for_pub(fig, output_path, formats=formats)
         print(f"Saved: {output_path}.png")
 
     return fig
 
 
-def plot_metrics_correlation(metrics: pd.DataFrame, output_path: str = None):
+def correlation_matrix(values: np.ndarray) -> np.ndarray:
+    """Pearson correlation of (n, k) metric columns over designs with no missing values."""
+    missing = np.isnan(values).any(axis=1)
+    if missing.any():  # Validated BoltzGen CSVs are complete; only copy when not
+        values = values[~missing]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.corrcoef(values, rowvar=False)
+
+
+def plot_metrics_correlation(metrics: pd.DataFrame, output_path: str = None,
+                             formats: tuple = DEFAULT_FORMATS, fig: plt.Figure = None):
     """
     Plot 8: Correlation heatmap of metrics.
     """
-    fig, ax = plt.subplots(figsize=FIGSIZE)
+    fig = new_figure(FIGSIZE, fig)
+    ax = fig.subplots()
 
     # Select numeric columns
-    metric_cols = ['pTM', 'iPTM', 'pAE', 'H_bonds', 'delta_SASA']
-    available_cols = [col for col in metric_cols if col in metrics.columns]
+    available_cols, values = summary_values(metrics)
 
     if len(available_cols) < 2:
         ax.text(0.5, 0.5, 'Insufficient metrics for correlation',
                 ha='center', va='center', transform=ax.transAxes)
         ax.axis('off')
         if output_path:
-            save_for_pub(fig, output_path)
+            save_for_pub(fig, output_path, formats=formats)
         return fig
 
     # Calculate correlation matrix
-    corr_matrix = metrics[available_cols].corr()
+    corr_matrix = correlation_matrix(values)
 
     # Create heatmap
-    im = ax.imshow(corr_matrix.values, cmap='RdYlGn', vmin=-1, vmax=1, aspect='equal')
+    im = ax.imshow(corr_matrix, cmap='RdYlGn', vmin=-1, vmax=1, aspect='equal')
 
     # Add text annotations
-    for i in range(len(available_cols)):
-        for j in range(len(available_cols)):
-            val = corr_matrix.iloc[i, j]
-            color = 'white' if abs(val) > 0.6 else 'black'
-            ax.text(j, i, f'{val:.2f}', ha='center', va='center', fontsize=12,
-                   fontweight='bold', color=color)
+    text_colors = np.where(np.abs(corr_matrix) > 0.6, 'white', 'black')
+    annotate_cells(ax, corr_matrix, text_colors, fontsize=12, fontweight='bold')
 
     # Set ticks
     ax.set_xticks(np.arange(len(available_cols)))
@@ -626,20 +1030,28 @@ def plot_metrics_correlation(metrics: pd.DataFrame, output_path: str = None):
     cbar = plt.colorbar(im, ax=ax, shrink=0.8)
     cbar.set_label('Correlation', fontsize=10)
 
-    plt.tight_layout()
-
     if output_path:
-        save_for_pub(fig, output_path)
+        save_for_pub(fig, output_path, formats=formats)
         print(f"Saved: {output_path}.png")
 
     return fig
 
 
-def create_merged_figure(metrics: pd.DataFrame, output_path: str = None) -> plt.Figure:
+def create_merged_figure(metrics: pd.DataFrame, output_path: str = None,
+                         summary: dict = None, rank_key: np.ndarray = None,
+                         formats: tuple = DEFAULT_FORMATS) -> plt.Figure:
     """
     Create a merged figure with all 8 panels arranged in a 2x4 grid.
     """
-    fig = plt.figure(figsize=(16, 8))
+    if summary is None:
+        summary = summarize_metrics(metrics)
+    if rank_key is None:
+        rank_key = compute_rank_key(metrics)
+    # Panels D, E and H all read the summary metrics; extract them once
+    available_cols, metrics_np = summary_values(metrics)
+
+    fig, axd = plt.subplot_mosaic([['A', 'B', 'C', 'D'], ['E', 'F', 'G', 'H']],
+                                  figsize=(16, 8), constrained_layout=True)
 
     panel_titles = [
         'A. Quality Score Distribution',
@@ -653,27 +1065,23 @@ def create_merged_figure(metrics: pd.DataFrame, output_path: str = None) -> plt.
     ]
 
     # --- Panel A: Quality Score Distribution ---
-    ax1 = fig.add_subplot(2, 4, 1)
+    ax1 = axd['A']
     if 'quality_score' in metrics.columns:
-        scores = metrics['quality_score'].values
-        status = metrics['Status'].values if 'Status' in metrics.columns else ['Unknown'] * len(metrics)
-        has_failed = 'Failed' in status
+        scores, passed_scores, failed_scores, has_failed = split_quality_scores(metrics)
         bins = np.linspace(0, 1, 11)
+        ref_lines = []
 
         if has_failed:
-            passed_mask = np.array(status) == 'Passed'
-            failed_mask = np.array(status) == 'Failed'
-            passed_scores = scores[passed_mask]
-            failed_scores = scores[failed_mask]
             ax1.hist([failed_scores, passed_scores], bins=bins, stacked=True,
                     color=['#d73027', '#1a9850'], alpha=0.8, edgecolor='white', linewidth=1,
                     label=['Failed', 'Passed'])
         else:
             mean_score = np.mean(scores)
-            ax1.hist(scores, bins=bins, color=CAT_PALETTE[0], alpha=0.8, edgecolor='white', linewidth=1)
-            ax1.axvline(x=mean_score, color='red', linestyle='-', linewidth=1.5, label=f'Mean ({mean_score:.2f})')
+            ax1.hist(scores, bins=bins, color=cat_palette()[0], alpha=0.8, edgecolor='white', linewidth=1)
+            ref_lines.append((mean_score, 'red', '-', f'Mean ({mean_score:.2f})'))
 
-        ax1.axvline(x=0.6, color='gray', linestyle='--', linewidth=1.5, label='Threshold')
+        ref_lines.append((0.6, 'gray', '--', 'Threshold'))
+        add_reference_vlines(ax1, ref_lines, linewidth=1.5)
         ax1.set_xlabel('Quality Score', fontsize=9)
         ax1.set_ylabel('Count', fontsize=9)
         ax1.set_xlim(0, 1)
@@ -682,15 +1090,14 @@ def create_merged_figure(metrics: pd.DataFrame, output_path: str = None) -> plt.
     prettify_ax(ax1)
 
     # --- Panel B: Structure Quality Assessment ---
-    ax2 = fig.add_subplot(2, 4, 2)
-    ptm = metrics['pTM'].values if 'pTM' in metrics.columns else np.zeros(len(metrics))
-    iptm = metrics['iPTM'].values if 'iPTM' in metrics.columns else np.zeros(len(metrics))
-    pae = metrics['pAE'].values if 'pAE' in metrics.columns else np.ones(len(metrics)) * 10
-    pae_max = max(pae.max(), 30)
-    pae_inv = 1 - np.clip(pae, 0, pae_max) / pae_max
+    ax2 = axd['B']
+    ptm = column_values(metrics, 'pTM')
+    iptm = column_values(metrics, 'iPTM')
+    pae_inv = summary['pae_quality']
     dot_size = 40
     scatter2 = ax2.scatter(iptm, ptm, c=pae_inv, s=dot_size, cmap=RYG_CMAP,
-                          alpha=0.85, edgecolors='white', linewidth=0.5, vmin=0, vmax=1)
+                          alpha=0.85, edgecolors='white', linewidth=0.5, vmin=0, vmax=1,
+                          rasterized=len(metrics) >= RASTERIZE_MIN_DESIGNS)
     ax2.axhline(y=THRESHOLDS['pTM'], color='gray', linestyle='--', linewidth=1, alpha=0.7)
     ax2.axvline(x=THRESHOLDS['iPTM'], color='gray', linestyle='--', linewidth=1, alpha=0.7)
     ax2.set_xlabel('iPTM', fontsize=9)
@@ -699,34 +1106,16 @@ def create_merged_figure(metrics: pd.DataFrame, output_path: str = None) -> plt.
     prettify_ax(ax2)
 
     # --- Panel C: Normalized Heatmap ---
-    ax3 = fig.add_subplot(2, 4, 3)
+    ax3 = axd['C']
     n_designs = len(metrics)
     design_labels = [str(i+1).zfill(3) for i in range(n_designs)]
-    data = []
-    row_labels = []
-    if 'pTM' in metrics.columns:
-        data.append(metrics['pTM'].values)
-        row_labels.append('pTM')
-    if 'iPTM' in metrics.columns:
-        data.append(metrics['iPTM'].values)
-        row_labels.append('iPTM')
-    if 'pAE' in metrics.columns:
-        pae = metrics['pAE'].values
-        pae_inv = 1 - (pae - pae.min()) / (pae.max() - pae.min() + 1e-6)
-        data.append(pae_inv)
-        row_labels.append('pAE (inv)')
-    if 'H_bonds' in metrics.columns:
-        hbonds = metrics['H_bonds'].values
-        hbonds_norm = np.clip(hbonds, 0, 10) / 10
-        data.append(hbonds_norm)
-        row_labels.append('H-bonds')
-    data = np.array(data)
+    # Panel C omits delta SASA to keep the compact heatmap readable
+    panel_rows = [r for r, col in enumerate(summary['columns']) if col != 'delta_SASA']
+    data = summary['norm'][panel_rows]
+    row_labels = [summary['labels'][r] for r in panel_rows]
     im3 = ax3.imshow(data, cmap=RYG_CMAP, aspect='auto', vmin=0, vmax=1)
-    for i in range(len(row_labels)):
-        for j in range(n_designs):
-            text = f'{data[i, j]:.2f}'
-            color = 'white' if data[i, j] < 0.4 or data[i, j] > 0.7 else 'black'
-            ax3.text(j, i, text, ha='center', va='center', fontsize=7, color=color)
+    text_colors = np.where((data < 0.4) | (data > 0.7), 'white', 'black')
+    annotate_cells(ax3, data, text_colors, fontsize=7)
     ax3.set_xticks(np.arange(n_designs))
     ax3.set_xticklabels(design_labels, fontsize=8)
     ax3.set_yticks(np.arange(len(row_labels)))
@@ -734,19 +1123,9 @@ def create_merged_figure(metrics: pd.DataFrame, output_path: str = None) -> plt.
     ax3.set_title(panel_titles[2], fontsize=10, fontweight='bold', loc='left')
 
     # --- Panel D: Metrics Statistics Table ---
-    ax4 = fig.add_subplot(2, 4, 4)
+    ax4 = axd['D']
     ax4.axis('off')
-    stats_data = []
-    metric_names = ['pTM', 'iPTM', 'pAE', 'H_bonds', 'delta_SASA']
-    for metric in metric_names:
-        if metric in metrics.columns:
-            values = metrics[metric].values
-            mean_val = np.mean(values)
-            std_val = np.std(values)
-            min_val = np.min(values)
-            max_val = np.max(values)
-            stats_data.append([metric, f'{mean_val:.2f}', f'{std_val:.2f}',
-                              f'{min_val:.2f}', f'{max_val:.2f}'])
+    stats_data = metric_statistics_rows(available_cols, metrics_np)
     col_labels = ['Metric', 'Mean', 'Std', 'Min', 'Max']
     table4 = ax4.table(cellText=stats_data, colLabels=col_labels,
                        loc='center', cellLoc='center',
@@ -760,18 +1139,19 @@ def create_merged_figure(metrics: pd.DataFrame, output_path: str = None) -> plt.
     ax4.set_title(panel_titles[3], fontsize=10, fontweight='bold', loc='left')
 
     # --- Panel E: Quality Boxplot ---
-    ax5 = fig.add_subplot(2, 4, 5)
+    ax5 = axd['E']
     metric_data = []
     metric_labels = []
-    for metric in ['pTM', 'iPTM', 'pAE', 'H_bonds']:
-        if metric in metrics.columns:
-            metric_data.append(metrics[metric].values)
+    for metric, _ in BOXPLOT_METRICS:
+        if metric in available_cols:
+            metric_data.append(metrics_np[:, available_cols.index(metric)])
             metric_labels.append(metric)
     if metric_data:
         bp = ax5.boxplot(metric_data, patch_artist=True, showfliers=True,
                         flierprops=dict(marker='o', markerfacecolor='red', markersize=4,
                                        markeredgecolor='darkred', alpha=0.7))
-        colors = [CAT_PALETTE[i % len(CAT_PALETTE)] for i in range(len(metric_data))]
+        palette = cat_palette()
+        colors = [palette[i % len(palette)] for i in range(len(metric_data))]
         for patch, color in zip(bp['boxes'], colors):
             patch.set_facecolor(color)
             patch.set_alpha(0.7)
@@ -780,95 +1160,107 @@ def create_merged_figure(metrics: pd.DataFrame, output_path: str = None) -> plt.
     prettify_ax(ax5)
 
     # --- Panel F: Interface Metrics ---
-    ax6 = fig.add_subplot(2, 4, 6)
-    hbonds = metrics['H_bonds'].values if 'H_bonds' in metrics.columns else np.zeros(len(metrics))
-    sasa = metrics['delta_SASA'].values if 'delta_SASA' in metrics.columns else np.zeros(len(metrics))
-    iptm = metrics['iPTM'].values if 'iPTM' in metrics.columns else np.ones(len(metrics)) * 0.5
+    ax6 = axd['F']
+    hbonds = column_values(metrics, 'H_bonds')
+    sasa = column_values(metrics, 'delta_SASA')
+    iptm = column_values(metrics, 'iPTM', 0.5)
     scatter6 = ax6.scatter(hbonds, sasa, c=iptm, cmap='plasma',
-                          s=60, alpha=0.8, edgecolors='white', linewidth=0.5)
+                          s=60, alpha=0.8, edgecolors='white', linewidth=0.5,
+                          rasterized=len(metrics) >= RASTERIZE_MIN_DESIGNS)
     ax6.set_xlabel('H-bonds', fontsize=9)
     ax6.set_ylabel('delta SASA', fontsize=9)
     ax6.set_title(panel_titles[5], fontsize=10, fontweight='bold', loc='left')
     prettify_ax(ax6)
 
     # --- Panel G: Top 5 Designs Table ---
-    ax7 = fig.add_subplot(2, 4, 7)
+    ax7 = axd['G']
     ax7.axis('off')
-    status_arr = metrics['Status'].values if 'Status' in metrics.columns else ['Unknown'] * len(metrics)
-    if 'final_rank' in metrics.columns:
-        rank_values = metrics['final_rank'].values
-    elif 'quality_score' in metrics.columns:
-        rank_values = -metrics['quality_score'].values
-    else:
-        rank_values = np.arange(len(metrics))
-    status_score = np.array([0 if s == 'Passed' else 1 for s in status_arr])
-    combined_rank = status_score * 1000 + rank_values
-    n_top = min(5, len(metrics))
-    ranked_indices = np.argsort(combined_rank)[:n_top]
-    table_data = []
-    colors = []
-    for rank, idx in enumerate(ranked_indices, 1):
-        design = metrics['Design'].iloc[idx] if 'Design' in metrics.columns else f'design_{idx+1:03d}'
-        short_name = str(design).split('_')[-1] if '_' in str(design) else str(design)[-10:]
-        ptm = metrics['pTM'].iloc[idx] if 'pTM' in metrics.columns else 0
-        iptm = metrics['iPTM'].iloc[idx] if 'iPTM' in metrics.columns else 0
-        status = status_arr[idx]
-        if status == 'Passed':
-            row_color = ['#90EE90'] * 5
-        else:
-            row_color = ['#FFB6C1'] * 5
-        table_data.append([rank, short_name, f'{ptm:.2f}', f'{iptm:.2f}', status])
-        colors.append(row_color)
+    top = top_designs(metrics, rank_key)
+    short_names = [str(d).split('_')[-1] if '_' in str(d) else str(d)[-10:] for d in top['Design']]
+    table_data = [list(row) for row in zip(
+        range(1, len(short_names) + 1),
+        short_names,
+        np.char.mod('%.2f', top['pTM']),
+        np.char.mod('%.2f', top['iPTM']),
+        top['Status'],
+    )]
     col_labels = ['#', 'Design', 'pTM', 'iPTM', 'Status']
-    table7 = ax7.table(cellText=table_data, colLabels=col_labels,
-                       loc='center', cellLoc='center', cellColours=colors,
-                       colWidths=[0.08, 0.3, 0.15, 0.15, 0.2])
-    table7.auto_set_font_size(False)
-    table7.set_fontsize(9)
-    table7.scale(1.0, 1.8)
-    for j in range(len(col_labels)):
-        table7[(0, j)].set_facecolor('#404040')
-        table7[(0, j)].set_text_props(color='white', fontweight='bold')
+    colors = status_row_colors(top['status_code'], len(col_labels))
+    draw_table_image(ax7, table_data, col_labels, colors,
+                     col_widths=[0.08, 0.3, 0.15, 0.15, 0.2])
     ax7.set_title(panel_titles[6], fontsize=10, fontweight='bold', loc='left')
 
     # --- Panel H: Metrics Correlation ---
-    ax8 = fig.add_subplot(2, 4, 8)
-    metric_cols = ['pTM', 'iPTM', 'pAE', 'H_bonds', 'delta_SASA']
-    available_cols = [col for col in metric_cols if col in metrics.columns]
+    ax8 = axd['H']
     if len(available_cols) >= 2:
-        corr_matrix = metrics[available_cols].corr()
-        im8 = ax8.imshow(corr_matrix.values, cmap='RdYlGn', vmin=-1, vmax=1, aspect='auto')
-        for i in range(len(available_cols)):
-            for j in range(len(available_cols)):
-                val = corr_matrix.iloc[i, j]
-                color = 'white' if abs(val) > 0.6 else 'black'
-                ax8.text(j, i, f'{val:.2f}', ha='center', va='center', fontsize=9,
-                        fontweight='bold', color=color)
+        corr_matrix = correlation_matrix(metrics_np)
+        im8 = ax8.imshow(corr_matrix, cmap='RdYlGn', vmin=-1, vmax=1, aspect='auto')
+        text_colors = np.where(np.abs(corr_matrix) > 0.6, 'white', 'black')
+        annotate_cells(ax8, corr_matrix, text_colors, fontsize=9, fontweight='bold')
         ax8.set_xticks(np.arange(len(available_cols)))
         ax8.set_xticklabels(available_cols, fontsize=8, rotation=45, ha='right')
         ax8.set_yticks(np.arange(len(available_cols)))
         ax8.set_yticklabels(available_cols, fontsize=8)
     ax8.set_title(panel_titles[7], fontsize=10, fontweight='bold', loc='left')
 
-    # Adjust spacing
-    plt.subplots_adjust(left=0.05, right=0.98, top=0.95, bottom=0.08, wspace=0.25, hspace=0.3)
-
     if output_path:
-        fig.savefig(output_path + ".png", dpi=200, bbox_inches='tight', facecolor='white')
-        fig.savefig(output_path + ".pdf", dpi=300, bbox_inches='tight', facecolor='white')
-        print(f"Saved merged figure: {output_path}.png and {output_path}.pdf")
+        if 'png' in formats:
+            bbox = write_png(fig, f"{output_path}.png", dpi=200)
+        else:
+            freeze_layout(fig)
+            bbox = tight_bbox(fig)
+        for ext in formats:
+            if ext != 'png':
+                fig.savefig(f"{output_path}.{ext}", dpi=300, bbox_inches=bbox, facecolor='white')
+        print("Saved merged figure: " + ' and '.join(f"{output_path}.{ext}" for ext in formats))
 
     return fig
 
 
-def create_all_figures(results_dir: str, output_prefix: str = None, merged: bool = True) -> List[str]:
+# Individual figures: (file suffix, plot function), in output order
+FIGURES = [
+    ('quality_score', plot_quality_score_distribution),
+    ('structure_quality', plot_structure_quality_assessment),
+    ('normalized_heatmap', plot_normalized_heatmap),
+    ('statistics_table', plot_metrics_statistics_table),
+    ('quality_boxplot', plot_quality_boxplot),
+    ('interface_metrics', plot_interface_metrics),
+    ('top5_designs', plot_top5_designs_table),
+    ('correlation', plot_metrics_correlation),
+]
+
+# Worker processes for rendering figures in parallel
+WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _render_figure(suffix: str, metrics: pd.DataFrame, output_path: str, kwargs: dict) -> str:
+    """Process-pool worker: build and save one figure, or the merged summary."""
+    set_pub_plot_context(context="talk")
+    if suffix == 'summary':
+        fig = create_merged_figure(metrics, output_path, **kwargs)
+    else:
+        fig = dict(FIGURES)[suffix](metrics, output_path, **kwargs)
+    plt.close(fig)
+    return f"{output_path}.png"
+
+
+def create_all_figures(results_dir: str, output_prefix: str = None, merged: bool = True,
+                       force: bool = False, parallel: bool = True,
+                       formats: tuple = DEFAULT_FORMATS) -> List[str]:
     """
     Create all eight visualization figures.
 
+    Figures are skipped when every output is newer than both the design CSV
+    and this script, unless `force` is set.
+
     Args:
         results_dir: Path to results directory
         output_prefix: Path prefix for saving (without extension)
         merged: If True, also generate a merged figure with all 8 panels
+        force: If True, regenerate figures even if they are up to date
+        parallel: If True, render figures in a process pool (one figure per
+            job) when more than one CPU is available
+        formats: File formats to write for every figure, e.g. ('png', 'pdf')
 
     Returns:
         list: Paths to saved figures
@@ -882,6 +1274,14 @@ def create_all_figures(results_dir: str, output_prefix: str = None, merged: bool
     if output_prefix is None:
         output_prefix = str(figures_dir / "nanobody_design")
 
+    # Skip rendering when outputs are newer than the data and this script
+    suffixes = [suffix for suffix, _ in FIGURES] + (['summary'] if merged else [])
+    targets = [f"{output_prefix}_{suffix}.{ext}" for suffix in suffixes for ext in formats]
+    csv_path = find_design_csv(results_dir)
+    if not force and outputs_up_to_date(targets, [csv_path, Path(__file__)]):
+        print(f"Figures up to date: {output_prefix}_* (use --force to regenerate)")
+        return [f"{output_prefix}_{suffix}.png" for suffix in suffixes]
+
     # Set publication-quality plot context
     set_pub_plot_context(context="talk")
 
@@ -893,58 +1293,65 @@ def create_all_figures(results_dir: str, output_prefix: str = None, merged: bool
         print("Error: No design data found")
         return None
 
+    # Skip rendering when the CSV was rewritten but its contents did not change
+    cache_path = Path(f"{output_prefix}.cache.json")
+    signature = metrics_signature(metrics)
+    if not force and all(Path(t).exists() for t in targets) and read_signature(cache_path) == signature:
+        for t in targets:
+            os.utime(t)  # Let the next run stop at the mtime check
+        print(f"Figures up to date (data unchanged): {output_prefix}_* (use --force to regenerate)")
+        return [f"{output_prefix}_{suffix}.png" for suffix in suffixes]
+
     # Print summary
-    n_passed = (metrics['Status'] == 'Passed').sum() if 'Status' in metrics.columns else 0
-    n_failed = (metrics['Status'] == 'Failed').sum() if 'Status' in metrics.columns else 0
+    n_failed, n_passed, _ = np.bincount(status_codes(metrics), minlength=3)
     print(f"Status: {n_passed} Passed, {n_failed} Failed")
 
-    saved_files = []
-
-    # Figure 1: Quality Score Distribution
-    fig1 = plot_quality_score_distribution(metrics, f"{output_prefix}_quality_score")
-    saved_files.append(f"{output_prefix}_quality_score.png")
-    plt.close(fig1)
-
-    # Figure 2: Structure Quality Assessment
-    fig2 = plot_structure_quality_assessment(metrics, f"{output_prefix}_structure_quality")
-    saved_files.append(f"{output_prefix}_structure_quality.png")
-    plt.close(fig2)
-
-    # Figure 3: Normalized Heatmap
-    fig3 = plot_normalized_heatmap(metrics, f"{output_prefix}_normalized_heatmap")
-    saved_files.append(f"{output_prefix}_normalized_heatmap.png")
-    plt.close(fig3)
-
-    # Figure 4: Metrics Statistics Table
-    fig4 = plot_metrics_statistics_table(metrics, f"{output_prefix}_statistics_table")
-    saved_files.append(f"{output_prefix}_statistics_table.png")
-    plt.close(fig4)
-
-    # Figure 5: Quality Boxplot
-    fig5 = plot_quality_boxplot(metrics, f"{output_prefix}_quality_boxplot")
-    saved_files.append(f"{output_prefix}_quality_boxplot.png")
-    plt.close(fig5)
-
-    # Figure 6: Interface Metrics
-    fig6 = plot_interface_metrics(metrics, f"{output_prefix}_interface_metrics")
-    saved_files.append(f"{output_prefix}_interface_metrics.png")
-    plt.close(fig6)
-
-    # Figure 7: Top 5 Designs Table
-    fig7 = plot_top5_designs_table(metrics, f"{output_prefix}_top5_designs")
-    saved_files.append(f"{output_prefix}_top5_designs.png")
-    plt.close(fig7)
-
-    # Figure 8: Metrics Correlation
-    fig8 = plot_metrics_correlation(metrics, f"{output_prefix}_correlation")
-    saved_files.append(f"{output_prefix}_correlation.png")
-    plt.close(fig8)
-
-    # Generate merged figure if requested
-    if merged:
-        merged_fig = create_merged_figure(metrics, f"{output_prefix}_summary")
-        saved_files.append(f"{output_prefix}_summary.png")
-        plt.close(merged_fig)
+    # Normalize metrics and count threshold passes once for all figures
+    summary = summarize_metrics(metrics)
+    if summary['columns']:
+        met = ', '.join(f"{col} {count}/{len(metrics)}"
+                        for col, count in zip(summary['columns'], summary['counts']))
+        print(f"Thresholds met: {met}")
+
+    # Design ranking shared by the top-5 table and the merged figure
+    rank_key = compute_rank_key(metrics)
+
+    # Extra inputs shared across figures, keyed by file suffix
+    shared_kwargs = {
+        'structure_quality': {'summary': summary},
+        'normalized_heatmap': {'summary': summary},
+        'top5_designs': {'rank_key': rank_key},
+    }
+    for suffix, _ in FIGURES:
+        shared_kwargs.setdefault(suffix, {})['formats'] = formats
+
+    if parallel and WORKERS > 1:
+        # Figures are independent, so each one is built and saved in its own process
+        jobs = [(suffix, shared_kwargs[suffix]) for suffix, _ in FIGURES]
+        if merged:
+            jobs.append(('summary', {'summary': summary, 'rank_key': rank_key, 'formats': formats}))
+        with ProcessPoolExecutor(max_workers=min(WORKERS, len(jobs))) as pool:
+            futures = [pool.submit(_render_figure, suffix, metrics, f"{output_prefix}_{suffix}", kwargs)
+                       for suffix, kwargs in jobs]
+            saved_files = [future.result() for future in futures]
+    else:
+        # Single process: draw and save every figure on one reused Figure
+        saved_files = []
+        fig = None
+        for suffix, plot_fn in FIGURES:
+            path = f"{output_prefix}_{suffix}"
+            fig = plot_fn(metrics, path, fig=fig, **shared_kwargs[suffix])
+            saved_files.append(f"{path}.png")
+        plt.close(fig)
+
+        # Generate merged figure if requested
+        if merged:
+            merged_fig = create_merged_figure(metrics, f"{output_prefix}_summary", summary=summary,
+                                              rank_key=rank_key, formats=formats)
+            saved_files.append(f"{output_prefix}_summary.png")
+            plt.close(merged_fig)
+
+    cache_path.write_text(json.dumps({'signature': signature}))
 
     print(f"\nGenerated {len(saved_files)} figures:")
     for f in saved_files:
@@ -995,13 +1402,17 @@ def show_summary_figure(results_dir: str, output_prefix: str = None, block: bool
             except:
                 pass
 
-        from PIL import Image
-
         plt.ion()
-        img = Image.open(summary_path)
-
         fig, ax = plt.subplots(figsize=(16, 8))
-        ax.imshow(img)
+
+        # Downsample to the on-screen size, then decode straight to uint8 RGB
+        # so imshow skips normalization
+        img = Image.open(summary_path).convert('RGB')
+        width, height = fig.get_size_inches() * fig.dpi
+        img.thumbnail((int(width), int(height)), Image.LANCZOS)
+        img = np.asarray(img)
+
+        ax.imshow(img, interpolation='none')
         ax.axis('off')
         ax.set_title('Nanobody Design Summary', fontsize=14, fontweight='bold')
 
@@ -1018,10 +1429,18 @@ def main():
                         help='Output prefix (default: results_dir/figures/nanobody_design)')
     parser.add_argument('--display', '-d', action='store_true',
                         help='Display summary figure after generation')
+    parser.add_argument('--force', '-f', action='store_true',
+                        help='Regenerate figures even if they are newer than the design CSV')
+    parser.add_argument('--pdf', action='store_true',
+                        help='Also save vector PDF versions of every figure (slower)')
+    parser.add_argument('--sequential', action='store_true',
+                        help='Render all figures in this process instead of a process pool')
 
     args = parser.parse_args()
 
-    output_files = create_all_figures(args.results_dir, args.output)
+    output_files = create_all_figures(args.results_dir, args.output, force=args.force,
+                                      parallel=not args.sequential,
+                                      formats=('png', 'pdf') if args.pdf else DEFAULT_FORMATS)
 
     if output_files:
         print(f"\nVisualization complete!")